@@ -39,6 +39,7 @@ class STTConfig:
     max_listen_timeout: float = 15
     vad_threshold: float = 0.3
     nudge_on_timeout: bool = False
+    batch_size: int = 1  # >1 batches 30s windows of long clips through the encoder
     audio_input_device: Optional[int] = None  # sounddevice device index, None = system default
 
 
@@ -125,6 +126,8 @@ def load_config(config_path: Optional[Path] = None) -> AppConfig:
                     config.stt.vad_threshold = float(stt["vad_threshold"])
                 if "nudge_on_timeout" in stt:
                     config.stt.nudge_on_timeout = bool(stt["nudge_on_timeout"])
+                if "batch_size" in stt:
+                    config.stt.batch_size = int(stt["batch_size"])
                 if "audio_input_device" in stt:
                     val = stt["audio_input_device"]
                     config.stt.audio_input_device = int(val) if val is not None else None
@@ -206,6 +209,7 @@ def save_config(config: AppConfig, config_path: Optional[Path] = None) -> None:
             "max_listen_timeout": config.stt.max_listen_timeout,
             "vad_threshold": config.stt.vad_threshold,
             "nudge_on_timeout": config.stt.nudge_on_timeout,
+            "batch_size": config.stt.batch_size,
             "audio_input_device": config.stt.audio_input_device,
         },
         "main_agent": config.main_agent,
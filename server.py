@@ -115,7 +115,9 @@ def _init_stt(config: AppConfig):
     from stt.mic_capture import MicCapture
 
     try:
-        _stt_engine = WhisperEngine(config.stt.model_size, config.stt.language)
+        _stt_engine = WhisperEngine(
+            config.stt.model_size, config.stt.language, batch_size=config.stt.batch_size
+        )
     except STTEngineError as e:
         logger.error(f"STT initialization failed: {e}")
         _stt_engine = None
@@ -586,7 +588,10 @@ def _shutdown():
     logger.info("Shutting down...")
 
     if _speech_queue is not None:
-        _speech_queue.stop()
+        _speech_queue.close()
+
+    if _audio_player is not None:
+        _audio_player.close()
 
     if _mic_capture is not None:
         _mic_capture.stop()
@@ -716,11 +721,8 @@ async def speak(name: str, text: str, speed: float = 1.0, block: bool = True) ->
 async def _transcribe_audio(audio) -> dict:
     """Transcribe provided audio data using faster-whisper (no mic)."""
     try:
-        loop = asyncio.get_running_loop()
         start = time.perf_counter()
-        result = await loop.run_in_executor(
-            None, _stt_engine.transcribe, audio, STT_SAMPLE_RATE
-        )
+        result = await _stt_engine.atranscribe(audio, STT_SAMPLE_RATE)
         elapsed_ms = (time.perf_counter() - start) * 1000
         return {
             "success": True,
@@ -801,8 +803,6 @@ async def listen(timeout: float = 15, prompt: str = "", silence_threshold: float
     paused_apps = duck() if (_config and _config.tts.duck_media and not _suppress_duck) else []
 
     try:
-        loop = asyncio.get_running_loop()
-
         start = time.perf_counter()
 
         # Reset VAD state from any prior recording (LSTM hidden state + context)
@@ -830,9 +830,7 @@ async def listen(timeout: float = 15, prompt: str = "", silence_threshold: float
         recording_ms = (time.perf_counter() - start) * 1000
 
         # Transcribe
-        result = await loop.run_in_executor(
-            None, _stt_engine.transcribe, audio, STT_SAMPLE_RATE
-        )
+        result = await _stt_engine.atranscribe(audio, STT_SAMPLE_RATE)
 
         total_ms = (time.perf_counter() - start) * 1000
 
@@ -24,6 +24,7 @@ MAX_CHUNK_LENGTH = 500       # Auto-chunk text longer than this (characters)
 SILENCE_THRESHOLD = 1.5      # Seconds of silence before stopping recording
 LISTEN_TIMEOUT = 15          # Default max seconds to wait for speech
 REGISTRY_SAVE_INTERVAL = 60  # Seconds between periodic registry saves
+REGISTRY_SAVE_DEBOUNCE = 1.0  # Seconds after the last voice assignment before saving
 DEFAULT_HTTP_PORT = 7865     # HTTP listener port for push-to-talk
 SESSIONS_FILE_NAME = "sessions.json"
 AUDIO_LOCK_PATH = "/tmp/voicesmith-audio.lock"
@@ -202,7 +203,7 @@ VOICE_METADATA: list[dict] = [
 
 # ─── Result Dataclasses ──────────────────────────────────────────────────────
 
-@dataclass
+@dataclass(frozen=True)
 class SynthesisResult:
     """Result from TTS engine synthesis."""
     samples: object  # numpy ndarray
@@ -211,7 +212,7 @@ class SynthesisResult:
     synthesis_ms: float
 
 
-@dataclass
+@dataclass(frozen=True)
 class PlaybackResult:
     """Result from audio player."""
     success: bool
@@ -243,9 +244,9 @@ class ListenResult:
     cancelled: bool = False
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class TranscriptionResult:
-    """Result from Whisper engine transcription."""
+    """Result from Whisper engine transcription (immutable, no per-instance dict)."""
     text: str
     confidence: float
     transcription_ms: float
@@ -20,6 +20,7 @@ logger = get_logger("stt.mic")
 
 _CHUNK_SAMPLES = 512        # Silero VAD requires exactly 512-sample chunks at 16kHz
 _CHUNK_BYTES   = _CHUNK_SAMPLES * 4   # float32 = 4 bytes/sample → 2048 bytes/chunk
+_BUFFER_DTYPE  = np.float16           # queued/recorded chunks; upcast to float32 for VAD and Whisper
 _ZERO_CHECK_CHUNKS = 25    # ~800ms — exceeds CoreAudio cold-start latency (~544ms)
 _ZERO_CHECK_CHUNKS_BT = 75 # ~2.4s — Bluetooth A2DP→HFP codec switch can take 1-2s
 
@@ -189,7 +190,7 @@ class MicCapture:
                         if not got:
                             return  # service closed connection
                         data += got
-                    self._audio_queue.put(np.frombuffer(data, dtype=np.float32).copy())
+                    self._audio_queue.put(np.frombuffer(data, dtype=np.float32).astype(_BUFFER_DTYPE))
             except Exception as exc:
                 logger.debug(f"socket reader thread exiting: {exc}")
 
@@ -199,7 +200,7 @@ class MicCapture:
 
         try:
             # Flush 2 chunks (~64ms) for AudioQueue hardware settle.
-            self._flush_queue(2)
+            await self._flush_queue(2)
             if on_ready:
                 on_ready()
             return await self._run_vad_loop(vad, timeout, silence_threshold, cancel_event)
@@ -228,7 +229,8 @@ class MicCapture:
             proc = subprocess.Popen(
                 [binary],
                 stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
+                # Never read; an undrained pipe would stall the binary once it fills
+                stderr=subprocess.DEVNULL,
                 close_fds=True,
             )
         except Exception as e:
@@ -243,7 +245,7 @@ class MicCapture:
                     data = proc.stdout.read(_CHUNK_BYTES)
                     if not data or len(data) < _CHUNK_BYTES:
                         break
-                    self._audio_queue.put(np.frombuffer(data, dtype=np.float32).copy())
+                    self._audio_queue.put(np.frombuffer(data, dtype=np.float32).astype(_BUFFER_DTYPE))
             except Exception as exc:
                 logger.debug(f"subprocess reader thread exiting: {exc}")
 
@@ -251,7 +253,7 @@ class MicCapture:
         reader_thread.start()
 
         try:
-            self._flush_queue(2)
+            await self._flush_queue(2)
             if on_ready:
                 on_ready()
             return await self._run_vad_loop(vad, timeout, silence_threshold, cancel_event)
@@ -299,7 +301,7 @@ class MicCapture:
             stream.start()
             logger.info("Microphone recording started (sounddevice)")
 
-            self._flush_queue(2, chunk_timeout=0.1)
+            await self._flush_queue(2, timeout=0.2)
             if on_ready:
                 on_ready()
             return await self._run_vad_loop(vad, timeout, silence_threshold, cancel_event)
@@ -319,13 +321,21 @@ class MicCapture:
 
     # ── Shared helpers ─────────────────────────────────────────────────────────
 
-    def _flush_queue(self, n_chunks: int, chunk_timeout: float = 0.15) -> None:
-        """Discard the first n_chunks from the audio queue (drops speaker bleed)."""
-        for _ in range(n_chunks):
+    async def _flush_queue(self, n_chunks: int, timeout: float = 0.3) -> None:
+        """Discard the first n_chunks from the audio queue (drops speaker bleed).
+
+        Polls the queue with short async sleeps instead of a blocking get, so
+        the event loop stays responsive while the hardware warms up.
+        """
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        flushed = 0
+        while flushed < n_chunks and loop.time() < deadline:
             try:
-                self._audio_queue.get(timeout=chunk_timeout)
+                self._audio_queue.get_nowait()
+                flushed += 1
             except queue.Empty:
-                break
+                await asyncio.sleep(0.01)
 
     # ── Shared VAD loop ────────────────────────────────────────────────────────
 
@@ -338,7 +348,7 @@ class MicCapture:
     ) -> Optional[np.ndarray]:
         """VAD recording loop — shared by all capture backends.
 
-        Reads 512-sample float32 chunks from self._audio_queue, runs Silero VAD
+        Reads 512-sample float16 chunks from self._audio_queue, runs Silero VAD
         on each, and returns when silence_threshold is exceeded after speech,
         timeout elapses, or cancel_event fires.
 
@@ -397,7 +407,9 @@ class MicCapture:
         if not chunks or not speech_detected:
             return None
 
-        return np.concatenate(chunks).flatten()
+        # Single upcast to the contiguous 1-D float32 buffer Whisper expects;
+        # ravel() is a view here, not a second copy.
+        return np.concatenate(chunks, dtype=np.float32).ravel()
 
     # ── sounddevice callback ───────────────────────────────────────────────────
 
@@ -405,7 +417,7 @@ class MicCapture:
         """Sounddevice callback — pushes audio chunks to the queue."""
         if status:
             logger.warning(f"Audio callback status: {status}")
-        self._audio_queue.put(indata.copy())
+        self._audio_queue.put(indata.astype(_BUFFER_DTYPE))
 
     # ── Error message ──────────────────────────────────────────────────────────
 
@@ -1,7 +1,12 @@
 """faster-whisper STT engine wrapper."""
 
-import math
+import array
+import asyncio
+import functools
+import io
+import threading
 import time
+import weakref
 
 import numpy as np
 
@@ -10,17 +15,137 @@ from shared import TranscriptionResult, STTEngineError, get_logger
 logger = get_logger("stt.whisper")
 
 
+def _select_device_and_compute_type() -> tuple[str, str]:
+    """Pick the CTranslate2 device and the fastest quantized compute type it supports.
+
+    CPU prefers int8; CUDA prefers int8_float16 (Tensor Cores), then float16.
+    Falls back to ("auto", "auto") if ctranslate2 cannot be queried.
+    """
+    try:
+        import ctranslate2
+        device = "cuda" if ctranslate2.get_cuda_device_count() > 0 else "cpu"
+        supported = ctranslate2.get_supported_compute_types(device)
+    except Exception:
+        return "auto", "auto"
+
+    preferred = ("int8",) if device == "cpu" else ("int8_float16", "float16")
+    for compute_type in preferred:
+        if compute_type in supported:
+            return device, compute_type
+    return device, "auto"
+
+
+# Silence gaps shorter than this are kept when VAD-trimming the encoder input
+_VAD_MIN_SILENCE_MS = 500
+
+# Serializes first-time loads so concurrent constructions don't load twice
+_model_lock = threading.Lock()
+
+
+# Models that have already run their warm-up pass (shared via _load_model's cache)
+_warmed_models = weakref.WeakSet()
+
+
+def _warm_up(model, language: str) -> None:
+    """Run one dummy transcription so first-call kernel selection happens at load time.
+
+    Also builds the peak-amplitude kernel, so its Numba compile isn't paid on
+    the first real transcribe().
+    """
+    if model in _warmed_models:
+        return
+    silence = np.zeros(16000, dtype=np.float32)
+    # Build (and JIT-compile, with Numba) the silence check transcribe() runs first
+    _peak_amplitude(silence)
+    try:
+        # vad_filter=False: a VAD pass would strip the silence and skip the encoder
+        segments, _ = model.transcribe(silence, language=language, vad_filter=False)
+        for _ in segments:
+            pass
+        logger.debug("Whisper warm-up complete")
+    except Exception as e:
+        logger.debug(f"Whisper warm-up failed: {e}")
+    _warmed_models.add(model)
+
+
+@functools.lru_cache(maxsize=4)
+def _load_model(model_size: str, device: str, compute_type: str):
+    """Load a WhisperModel, reusing an already-loaded instance for the same key."""
+    from faster_whisper import WhisperModel
+    return WhisperModel(model_size, device=device, compute_type=compute_type)
+
+
+_peak_kernel = None
+
+
+def _build_peak_kernel():
+    """Return a max-|sample| function: a Numba kernel if installed, else NumPy.
+
+    Both avoid materializing np.abs(audio) as a temporary array.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        return lambda audio: float(max(audio.max(), -audio.min()))
+
+    @njit(cache=True, fastmath=True)
+    def _peak(audio):
+        peak = 0.0
+        for x in audio:
+            a = abs(x)
+            if a > peak:
+                peak = a
+        return peak
+
+    return _peak
+
+
+def _peak_amplitude(audio: np.ndarray) -> float:
+    """Return the peak absolute amplitude of a non-empty 1-D float32 buffer."""
+    global _peak_kernel
+    if _peak_kernel is None:
+        # Built on first use so importing this module never pays for Numba
+        _peak_kernel = _build_peak_kernel()
+    return _peak_kernel(audio)
+
+
 class WhisperEngine:
     """Wrapper around faster-whisper for speech-to-text transcription."""
 
-    def __init__(self, model_size: str = "base", language: str = "en") -> None:
+    def __init__(
+        self,
+        model_size: str = "base",
+        language: str = "en",
+        batch_size: int = 1,
+        silence_peak: float = 1e-3,
+        vad_filter: bool = True,
+        warmup: bool = True,
+    ) -> None:
         self._loaded = False
         self._language = language
+        self._batch_size = batch_size
+        self._silence_peak = silence_peak
+        # Strip non-speech with faster-whisper's Silero pass before encoding
+        self._vad_options = (
+            {"vad_filter": True, "vad_parameters": {"min_silence_duration_ms": _VAD_MIN_SILENCE_MS}}
+            if vad_filter else {"vad_filter": False}
+        )
+        self._pipeline = None
         try:
-            from faster_whisper import WhisperModel
-            self._model = WhisperModel(model_size, device="auto", compute_type="auto")
+            device, compute_type = _select_device_and_compute_type()
+            with _model_lock:
+                self._model = _load_model(model_size, device, compute_type)
+                if warmup:
+                    _warm_up(self._model, language)
+            if batch_size > 1:
+                # Encode up to batch_size 30s windows of a clip per encoder call
+                from faster_whisper import BatchedInferencePipeline
+                self._pipeline = BatchedInferencePipeline(model=self._model)
             self._loaded = True
-            logger.info(f"Whisper STT engine loaded (model={model_size}, language={language})")
+            logger.info(
+                f"Whisper STT engine loaded (model={model_size}, language={language}, "
+                f"device={device}, compute_type={compute_type}, batch_size={batch_size})"
+            )
         except Exception as e:
             raise STTEngineError(f"Failed to load Whisper model: {e}") from e
 
@@ -28,7 +153,8 @@ class WhisperEngine:
         """Transcribe audio to text.
 
         Args:
-            audio: Audio samples as numpy ndarray (float32).
+            audio: Mono audio samples as a 1-D numpy ndarray. Contiguous
+                   float32 input is passed to the model without a copy.
             sample_rate: Sample rate of the audio (default 16000).
 
         Returns:
@@ -40,41 +166,62 @@ class WhisperEngine:
         if not self._loaded:
             raise STTEngineError("Whisper engine is not loaded")
 
+        # No-op for contiguous float32; otherwise one conversion here instead of in CT2
+        audio = np.ascontiguousarray(audio, dtype=np.float32)
+        if audio.ndim != 1:
+            raise STTEngineError(f"Expected 1-D mono audio, got shape {audio.shape}")
+
+        # Skip the encoder entirely for empty or near-silent input (peak below ~-60 dBFS)
+        if audio.size == 0 or _peak_amplitude(audio) < self._silence_peak:
+            logger.debug("Skipping transcription of silent audio")
+            return TranscriptionResult("", 0.0, 0.0, self._language)
+
         try:
-            start = time.perf_counter()
-            segments, info = self._model.transcribe(audio, language=self._language)
+            start_ns = time.perf_counter_ns()
+            if self._pipeline is not None:
+                segments, info = self._pipeline.transcribe(
+                    audio, language=self._language, batch_size=self._batch_size,
+                    **self._vad_options,
+                )
+            else:
+                segments, info = self._model.transcribe(
+                    audio, language=self._language, **self._vad_options
+                )
 
-            # Collect all segments
-            texts = []
-            log_probs = []
+            # Consume the segment generator in one pass
+            text_buf = io.StringIO()
+            log_probs = array.array("d")
             for segment in segments:
-                texts.append(segment.text)
+                text_buf.write(segment.text)
                 log_probs.append(segment.avg_logprob)
 
-            transcription_ms = (time.perf_counter() - start) * 1000
-            text = "".join(texts).strip()
+            transcription_ms = (time.perf_counter_ns() - start_ns) * 1e-6
+            text = text_buf.getvalue().strip()
 
-            # Compute confidence as exp(average log probability)
+            # Confidence = exp(mean log probability), clamped to [0.0, 1.0].
+            # frombuffer views the array('d') storage without copying.
             if log_probs:
-                avg_log_prob = sum(log_probs) / len(log_probs)
-                confidence = math.exp(avg_log_prob)
+                lp = np.frombuffer(log_probs, dtype=np.float64)
+                confidence = float(np.clip(np.exp(lp.mean()), 0.0, 1.0))
             else:
                 confidence = 0.0
 
-            # Clamp confidence to [0.0, 1.0]
-            confidence = max(0.0, min(1.0, confidence))
-
             return TranscriptionResult(
-                text=text,
-                confidence=confidence,
-                transcription_ms=transcription_ms,
-                language=info.language if hasattr(info, "language") else self._language,
+                text, confidence, transcription_ms, getattr(info, "language", self._language)
             )
         except STTEngineError:
             raise
         except Exception as e:
             raise STTEngineError(f"Transcription failed: {e}") from e
 
+    async def atranscribe(self, audio: np.ndarray, sample_rate: int = 16000) -> TranscriptionResult:
+        """Transcribe in a worker thread so the event loop stays responsive.
+
+        CTranslate2 releases the GIL while decoding, so other coroutines
+        (stop, mute, speak) keep running during transcription.
+        """
+        return await asyncio.to_thread(self.transcribe, audio, sample_rate)
+
     def is_loaded(self) -> bool:
         """Return whether the engine is loaded and ready."""
         return self._loaded
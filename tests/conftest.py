@@ -2,7 +2,7 @@
 
 import sys
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 import numpy as np
 import pytest
@@ -19,19 +19,54 @@ from shared import (
     SAMPLE_RATE,
     STT_SAMPLE_RATE,
 )
+from stt.whisper_engine import _peak_amplitude
+
+
+# 1 second of silence at the STT rate, shared read-only across test modules
+SILENCE_16K = np.zeros(STT_SAMPLE_RATE, dtype=np.float32)
+SILENCE_16K.setflags(write=False)
+
+# 1 second of silence at the TTS rate, shared read-only by the session mocks
+_SILENT_TTS_SAMPLES = np.zeros(SAMPLE_RATE, dtype=np.float32)
+_SILENT_TTS_SAMPLES.setflags(write=False)
+
+# Build the Numba kernel (when Numba is installed) before any test patches
+# sys.modules: Numba modules first imported inside patch.dict("sys.modules")
+# are dropped again on exit, and importing them twice breaks Numba's registries
+_peak_amplitude(SILENCE_16K)
+
+# Session-scoped mocks below are built once. Call history and side effects
+# are reset after every test that uses them; tests that need different
+# return values should build their own mock instead of mutating these.
+_SESSION_MOCKS = (
+    "mock_kokoro_engine",
+    "mock_audio_player",
+    "mock_speech_queue",
+    "mock_whisper_engine",
+    "mock_vad",
+    "mock_mic_capture",
+)
+
+
+@pytest.fixture(autouse=True)
+def _reset_session_mocks(request):
+    """Clear call state on any session-scoped mock the test used."""
+    yield
+    for name in _SESSION_MOCKS:
+        if name in request.fixturenames:
+            request.getfixturevalue(name).reset_mock(side_effect=True)
 
 
 # ─── TTS Fixtures ────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_kokoro_engine():
     """A mocked KokoroEngine that returns valid SynthesisResult."""
     engine = MagicMock()
     engine.is_loaded.return_value = True
 
-    samples = np.zeros(SAMPLE_RATE, dtype=np.float32)  # 1 second
     engine.synthesize.return_value = SynthesisResult(
-        samples=samples,
+        samples=_SILENT_TTS_SAMPLES,
         sample_rate=SAMPLE_RATE,
         duration_ms=1000.0,
         synthesis_ms=100.0,
@@ -39,7 +74,7 @@ def mock_kokoro_engine():
     return engine
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_audio_player():
     """A mocked AudioPlayer that succeeds."""
     player = MagicMock()
@@ -49,7 +84,7 @@ def mock_audio_player():
     return player
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_speech_queue(mock_kokoro_engine, mock_audio_player):
     """A mocked SpeechQueue."""
     queue = MagicMock()
@@ -70,7 +105,7 @@ def mock_speech_queue(mock_kokoro_engine, mock_audio_player):
 
 # ─── STT Fixtures ────────────────────────────────────────────────────────────
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_whisper_engine():
     """A mocked WhisperEngine that returns valid TranscriptionResult."""
     engine = MagicMock()
@@ -81,10 +116,11 @@ def mock_whisper_engine():
         transcription_ms=200.0,
         language="en",
     )
+    engine.atranscribe = AsyncMock(return_value=engine.transcribe.return_value)
     return engine
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_vad():
     """A mocked VoiceActivityDetector."""
     vad = MagicMock()
@@ -94,7 +130,7 @@ def mock_vad():
     return vad
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_mic_capture():
     """A mocked MicCapture."""
     mic = MagicMock()
@@ -1,8 +1,10 @@
 """Tests for voice_registry.py."""
 
+import asyncio
 import sys
 import json
 from pathlib import Path
+from unittest.mock import patch
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
@@ -67,6 +69,11 @@ class TestHashBasedAssignment:
 
         assert voice1 == voice2
 
+    def test_assignment_stable_across_processes(self):
+        """Pinned value: hash-based picks must not depend on PYTHONHASHSEED."""
+        voice, _ = VoiceRegistry().get_voice("AgentX")
+        assert voice == "af_heart"
+
     def test_different_names_get_different_voices(self):
         """Different names should generally get different voices."""
         reg = VoiceRegistry()
@@ -110,6 +117,22 @@ class TestPoolExhaustion:
         reg.get_voice("Nova")
         assert len(reg.get_available_pool()) == initial_pool - 2
 
+    def test_pool_regains_voice_when_reassigned(self):
+        reg = VoiceRegistry()
+        reg.get_voice("Eric")  # auto-assigns am_eric
+        reg.set_voice("Eric", "af_nova")
+        pool = reg.get_available_pool()
+        assert "am_eric" in pool
+        assert "af_nova" not in pool
+        assert pool == sorted(pool)
+
+    def test_shared_voice_stays_assigned_until_last_user_moves(self):
+        reg = VoiceRegistry(preloaded_registry={"A": "am_onyx", "B": "am_onyx"})
+        reg.set_voice("A", "af_nova")
+        assert "am_onyx" not in reg.get_available_pool()
+        reg.rename_voice("B", "C", "af_nova")
+        assert "am_onyx" in reg.get_available_pool()
+
 
 class TestSetVoice:
     """Test explicit voice assignment."""
@@ -175,6 +198,47 @@ class TestPersistence:
         assert data["main_agent"] == "Eric"
         assert data["voice_registry"]["Test"] == "am_adam"
 
+    def test_unchanged_registry_not_rewritten(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text(json.dumps({"voice_registry": {"Alice": "bf_alice"}}))
+        reg = VoiceRegistry(config_path=config_path)
+
+        with patch("tempfile.mkstemp") as mock_mkstemp:
+            reg.get_voice("Alice")  # existing entry, no change
+            reg.save()
+        mock_mkstemp.assert_not_called()
+
+        reg.set_voice("Bob", "bm_george")
+        reg.save()
+        reg.save()  # second save is a no-op again
+        assert json.loads(config_path.read_text())["voice_registry"]["Bob"] == "bm_george"
+
+    async def test_assignments_coalesced_into_one_debounced_save(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        reg = VoiceRegistry(config_path=config_path)
+
+        with patch("voice_registry.REGISTRY_SAVE_DEBOUNCE", 0.05), \
+                patch.object(reg, "save", wraps=reg.save) as mock_save:
+            reg.get_voice("Eric")
+            reg.get_voice("Nova")
+            reg.set_voice("Custom", "am_onyx")
+            mock_save.assert_not_called()
+
+            await asyncio.sleep(0.2)
+
+        mock_save.assert_called_once_with()
+        assert len(json.loads(config_path.read_text())["voice_registry"]) == 3
+
+    def test_no_scheduled_save_without_event_loop(self, tmp_path):
+        config_path = tmp_path / "config.json"
+        config_path.write_text("{}")
+        reg = VoiceRegistry(config_path=config_path)
+
+        reg.set_voice("Custom", "am_onyx")  # must not raise outside a loop
+
+        assert reg._save_handle is None
+
     def test_load_from_constructor(self, tmp_path):
         config_path = tmp_path / "config.json"
         config_path.write_text(json.dumps({
@@ -5,7 +5,6 @@ import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch, AsyncMock
 
-import numpy as np
 import pytest
 
 sys.path.insert(0, str(Path(__file__).parent.parent))
@@ -20,7 +19,9 @@ from shared import (
     ALL_VOICE_IDS,
     VOICE_METADATA,
 )
+import server
 from voice_registry import VoiceRegistry
+from tests.conftest import SILENCE_16K
 
 
 def _setup_server_globals(
@@ -34,8 +35,6 @@ def _setup_server_globals(
     muted=False,
 ):
     """Set up server module globals for testing."""
-    import server
-
     server._tts_engine = tts_engine
     server._audio_player = audio_player
     server._speech_queue = speech_queue
@@ -50,10 +49,32 @@ def _setup_server_globals(
     server._config = MagicMock()
     server._config.stt.model_size = "base"
     server._config.stt.language = "en"
+    return server
+
+
+_SERVER_GLOBALS = (
+    "_tts_engine", "_audio_player", "_speech_queue",
+    "_stt_engine", "_vad", "_mic_capture", "_registry", "_muted",
+    "_wake_listener", "_listen_active", "_listen_cancel_event", "_config",
+)
+
+
+@pytest.fixture
+def server_with():
+    """Factory fixture: configure server globals, restore them on teardown.
+
+    Call with the same keyword arguments as _setup_server_globals; returns
+    the configured server module.
+    """
+    saved = {name: getattr(server, name) for name in _SERVER_GLOBALS}
+    yield _setup_server_globals
+    for name, value in saved.items():
+        setattr(server, name, value)
 
 
-def _mock_tts():
-    """Return mocked TTS components."""
+@pytest.fixture
+def mock_tts():
+    """Mocked TTS components: (engine, player, queue)."""
     engine = MagicMock()
     engine.is_loaded.return_value = True
 
@@ -78,14 +99,16 @@ def _mock_tts():
     return engine, player, queue
 
 
-def _mock_stt():
-    """Return mocked STT components."""
+@pytest.fixture
+def mock_stt():
+    """Mocked STT components: (engine, vad, mic)."""
     engine = MagicMock()
     engine.is_loaded.return_value = True
     engine.transcribe.return_value = TranscriptionResult(
         text="hello world", confidence=0.95,
         transcription_ms=200.0, language="en",
     )
+    engine.atranscribe = AsyncMock(return_value=engine.transcribe.return_value)
 
     vad = MagicMock()
     vad.is_loaded.return_value = True
@@ -101,59 +124,49 @@ def _mock_stt():
 
 
 class TestSpeakTool:
-    @pytest.mark.asyncio
-    async def test_speak_blocking(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+    async def test_speak_blocking(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.speak("Eric", "Hello world", speed=1.0, block=True)
 
         assert result["success"] is True
         assert result["voice"] == "am_eric"
         assert "duration_ms" in result
 
-    @pytest.mark.asyncio
-    async def test_speak_nonblocking(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+    async def test_speak_nonblocking(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.speak("Eric", "Hello world", block=False)
 
         assert result["success"] is True
         assert result["queued"] is True
 
-    @pytest.mark.asyncio
-    async def test_speak_when_tts_unavailable(self):
-        _setup_server_globals()
+    async def test_speak_when_tts_unavailable(self, server_with):
+        server_with()
 
-        import server
         result = await server.speak("Eric", "Hello")
 
         assert result["success"] is False
         assert result["error"] == "tts_unavailable"
 
-    @pytest.mark.asyncio
-    async def test_speak_when_muted(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(
+    async def test_speak_when_muted(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(
             tts_engine=engine, audio_player=player, speech_queue=queue, muted=True
         )
 
-        import server
         result = await server.speak("Eric", "Hello", block=True)
 
         assert result["success"] is True
         assert result.get("muted") is True
         assert result["duration_ms"] == 0
 
-    @pytest.mark.asyncio
-    async def test_speak_auto_assigns_voice(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+    async def test_speak_auto_assigns_voice(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.speak("Eric", "Hello", block=True)
         assert result["auto_assigned"] is True  # First call auto-assigns
 
@@ -165,33 +178,27 @@ class TestSpeakTool:
 
 
 class TestListenTool:
-    @pytest.mark.asyncio
-    async def test_listen_when_stt_unavailable(self):
-        _setup_server_globals()
+    async def test_listen_when_stt_unavailable(self, server_with):
+        server_with()
 
-        import server
         result = await server.listen()
 
         assert result["success"] is False
         assert result["error"] == "stt_unavailable"
 
-    @pytest.mark.asyncio
-    async def test_listen_when_muted(self):
-        stt_engine, vad, mic = _mock_stt()
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic, muted=True)
+    async def test_listen_when_muted(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic, muted=True)
 
-        import server
         result = await server.listen()
 
         assert result["success"] is False
         assert result["error"] == "muted"
 
-    @pytest.mark.asyncio
-    async def test_listen_concurrent_rejection(self):
-        stt_engine, vad, mic = _mock_stt()
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic)
+    async def test_listen_concurrent_rejection(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic)
 
-        import server
         server._listen_active = True
 
         result = await server.listen()
@@ -200,34 +207,30 @@ class TestListenTool:
 
         server._listen_active = False
 
-    @pytest.mark.asyncio
-    async def test_listen_timeout(self):
-        stt_engine, vad, mic = _mock_stt()
+    async def test_listen_timeout(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
 
         async def mock_record(**kwargs):
             return None  # Timeout / no speech
 
         mic.record = mock_record
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic)
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic)
 
-        import server
         result = await server.listen(timeout=1)
 
         assert result["success"] is False
         assert result["error"] == "timeout"
 
-    @pytest.mark.asyncio
-    async def test_listen_successful_transcription(self):
-        stt_engine, vad, mic = _mock_stt()
-        audio = np.zeros(16000, dtype=np.float32)
+    async def test_listen_successful_transcription(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
+        audio = SILENCE_16K
 
         async def mock_record(**kwargs):
             return audio
 
         mic.record = mock_record
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic)
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic)
 
-        import server
         result = await server.listen(timeout=5)
 
         assert result["success"] is True
@@ -239,24 +242,20 @@ class TestListenTool:
 
 
 class TestStopTool:
-    @pytest.mark.asyncio
-    async def test_stop_playback(self):
-        engine, player, queue = _mock_tts()
+    async def test_stop_playback(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
         queue.stop.return_value = True
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.stop()
 
         assert result["success"] is True
         assert result["stopped_playback"] is True
 
-    @pytest.mark.asyncio
-    async def test_stop_cancels_listen(self):
-        stt_engine, vad, mic = _mock_stt()
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic)
+    async def test_stop_cancels_listen(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic)
 
-        import server
         server._listen_cancel_event = asyncio.Event()
         result = await server.stop()
 
@@ -268,33 +267,27 @@ class TestStopTool:
 
 
 class TestMuteUnmuteTool:
-    @pytest.mark.asyncio
-    async def test_mute(self):
-        _setup_server_globals()
+    async def test_mute(self, server_with):
+        server_with()
 
-        import server
         result = await server.mute_tool()
 
         assert result["success"] is True
         assert result["muted"] is True
         assert server._muted is True
 
-    @pytest.mark.asyncio
-    async def test_unmute(self):
-        _setup_server_globals(muted=True)
+    async def test_unmute(self, server_with):
+        server_with(muted=True)
 
-        import server
         result = await server.unmute_tool()
 
         assert result["success"] is True
         assert result["muted"] is False
         assert server._muted is False
 
-    @pytest.mark.asyncio
-    async def test_mute_unmute_cycle(self):
-        _setup_server_globals()
+    async def test_mute_unmute_cycle(self, server_with):
+        server_with()
 
-        import server
         await server.mute_tool()
         assert server._muted is True
 
@@ -306,9 +299,8 @@ class TestMuteUnmuteTool:
 
 
 class TestListVoicesTool:
-    @pytest.mark.asyncio
-    async def test_list_voices(self):
-        import server
+    async def test_list_voices(self, server_with):
+        server_with()
         result = await server.list_voices()
 
         assert "voices" in result
@@ -320,11 +312,9 @@ class TestListVoicesTool:
 
 
 class TestVoiceRegistryTool:
-    @pytest.mark.asyncio
-    async def test_get_voice_registry(self):
-        _setup_server_globals()
+    async def test_get_voice_registry(self, server_with):
+        server_with()
 
-        import server
         result = await server.get_voice_registry()
 
         assert "registry" in result
@@ -332,11 +322,9 @@ class TestVoiceRegistryTool:
         assert result["total_assigned"] == 0
         assert result["total_available"] == 54
 
-    @pytest.mark.asyncio
-    async def test_set_voice_valid(self):
-        _setup_server_globals()
+    async def test_set_voice_valid(self, server_with):
+        server_with()
 
-        import server
         result = await server.set_voice("TestAgent", "af_nova")
 
         assert result["success"] is True
@@ -344,11 +332,9 @@ class TestVoiceRegistryTool:
         assert result["voice"] == "af_nova"
         assert result["previous_name"] == "TestAgent"
 
-    @pytest.mark.asyncio
-    async def test_set_voice_invalid(self):
-        _setup_server_globals()
+    async def test_set_voice_invalid(self, server_with):
+        server_with()
 
-        import server
         result = await server.set_voice("TestAgent", "invalid_voice")
 
         assert result["success"] is False
@@ -359,16 +345,14 @@ class TestVoiceRegistryTool:
 
 
 class TestStatusTool:
-    @pytest.mark.asyncio
-    async def test_status_all_loaded(self):
-        engine, player, queue = _mock_tts()
-        stt_engine, vad, mic = _mock_stt()
-        _setup_server_globals(
+    async def test_status_all_loaded(self, mock_tts, mock_stt, server_with):
+        engine, player, queue = mock_tts
+        stt_engine, vad, mic = mock_stt
+        server_with(
             tts_engine=engine, audio_player=player, speech_queue=queue,
             stt_engine=stt_engine, vad=vad, mic_capture=mic,
         )
 
-        import server
         result = await server.status()
 
         assert result["tts"]["loaded"] is True
@@ -377,25 +361,21 @@ class TestStatusTool:
         assert result["muted"] is False
         assert "uptime_s" in result
 
-    @pytest.mark.asyncio
-    async def test_status_tts_only(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+    async def test_status_tts_only(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.status()
 
         assert result["tts"]["loaded"] is True
         assert result["stt"]["loaded"] is False
 
-    @pytest.mark.asyncio
-    async def test_status_when_muted(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(
+    async def test_status_when_muted(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(
             tts_engine=engine, audio_player=player, speech_queue=queue, muted=True
         )
 
-        import server
         result = await server.status()
         assert result["muted"] is True
 
@@ -404,33 +384,29 @@ class TestStatusTool:
 
 
 class TestSpeakThenListenTool:
-    @pytest.mark.asyncio
-    async def test_speak_then_listen_success(self):
-        engine, player, queue = _mock_tts()
-        stt_engine, vad, mic = _mock_stt()
-        audio = np.zeros(16000, dtype=np.float32)
+    async def test_speak_then_listen_success(self, mock_tts, mock_stt, server_with):
+        engine, player, queue = mock_tts
+        stt_engine, vad, mic = mock_stt
+        audio = SILENCE_16K
 
         async def mock_record(**kwargs):
             return audio
 
         mic.record = mock_record
-        _setup_server_globals(
+        server_with(
             tts_engine=engine, audio_player=player, speech_queue=queue,
             stt_engine=stt_engine, vad=vad, mic_capture=mic,
         )
 
-        import server
         result = await server.speak_then_listen("Eric", "What do you think?")
 
         assert result["speak"]["success"] is True
         assert result["listen"]["success"] is True
         assert result["listen"]["text"] == "hello world"
 
-    @pytest.mark.asyncio
-    async def test_speak_then_listen_tts_failure(self):
-        _setup_server_globals()
+    async def test_speak_then_listen_tts_failure(self, server_with):
+        server_with()
 
-        import server
         result = await server.speak_then_listen("Eric", "Hello?")
 
         assert result["speak"]["success"] is False
@@ -441,26 +417,22 @@ class TestSpeakThenListenTool:
 
 
 class TestGracefulDegradation:
-    @pytest.mark.asyncio
-    async def test_speak_works_without_stt(self):
-        engine, player, queue = _mock_tts()
-        _setup_server_globals(tts_engine=engine, audio_player=player, speech_queue=queue)
+    async def test_speak_works_without_stt(self, mock_tts, server_with):
+        engine, player, queue = mock_tts
+        server_with(tts_engine=engine, audio_player=player, speech_queue=queue)
 
-        import server
         result = await server.speak("Eric", "Hello", block=True)
         assert result["success"] is True
 
-    @pytest.mark.asyncio
-    async def test_listen_works_without_tts(self):
-        stt_engine, vad, mic = _mock_stt()
-        audio = np.zeros(16000, dtype=np.float32)
+    async def test_listen_works_without_tts(self, mock_stt, server_with):
+        stt_engine, vad, mic = mock_stt
+        audio = SILENCE_16K
 
         async def mock_record(**kwargs):
             return audio
 
         mic.record = mock_record
-        _setup_server_globals(stt_engine=stt_engine, vad=vad, mic_capture=mic)
+        server_with(stt_engine=stt_engine, vad=vad, mic_capture=mic)
 
-        import server
         result = await server.listen(timeout=5)
         assert result["success"] is True
@@ -3,7 +3,9 @@
 import asyncio
 import math
 import sys
+import threading
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
 
 import numpy as np
@@ -13,139 +15,230 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared import TranscriptionResult, STTEngineError, VADError, MicCaptureError
+from stt.mic_capture import MicCapture
+from stt.vad import VoiceActivityDetector
+from stt.whisper_engine import WhisperEngine, _load_model, _peak_amplitude
+from tests.conftest import SILENCE_16K
+
+# One 32 ms Silero window of silence, shared read-only by the VAD tests
+_SILENT_CHUNK_512 = np.zeros(512, dtype=np.float32)
+_SILENT_CHUNK_512.setflags(write=False)
+_SILENT_CHUNK_512_BYTES = _SILENT_CHUNK_512.tobytes()
+
+# Canned Silero session outputs: the zero recurrent state and one (1, 1)
+# probability array per speech_prob value, built once and shared read-only
+_ZERO_VAD_STATE = np.zeros((2, 1, 128), dtype=np.float32)
+_ZERO_VAD_STATE.setflags(write=False)
+_VAD_PROB_CACHE: dict[float, np.ndarray] = {}
+
+# Deterministic 100 ms mic chunks; the VAD is mocked so the content is never inspected
+_MIC_TEST_CHUNKS = np.random.default_rng(0).standard_normal((20, 1600, 1), dtype=np.float32)
 
 
 # ─── WhisperEngine Tests ─────────────────────────────────────────────────────
 
 
+@pytest.fixture(scope="module")
+def whisper_env():
+    """Patch in one mock faster_whisper module for the WhisperEngine tests."""
+    mock_fw = MagicMock()
+    with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
+        yield mock_fw
+
+
+@pytest.fixture
+def whisper(whisper_env):
+    """A freshly loaded WhisperEngine and the mock model behind it."""
+    mock_fw = whisper_env
+    mock_fw.WhisperModel.reset_mock()
+    mock_fw.WhisperModel.return_value = mock_model = MagicMock()
+    engine = WhisperEngine(model_size="base", language="en", warmup=False)
+    return engine, mock_model
+
+
 class TestWhisperEngine:
     """Tests for WhisperEngine transcription."""
 
-    def _make_engine(self):
-        """Create a WhisperEngine with a mocked faster_whisper module."""
+    @pytest.fixture(autouse=True)
+    def _clear_model_cache(self):
+        """Each test injects its own faster_whisper mock; drop cached models."""
+        _load_model.cache_clear()
+        yield
+        _load_model.cache_clear()
+
+    def test_engine_loads_successfully(self, whisper):
+        engine, _ = whisper
+        assert engine.is_loaded() is True
+
+    def test_model_reused_across_engines(self):
         mock_fw = MagicMock()
-        mock_model = MagicMock()
-        mock_fw.WhisperModel.return_value = mock_model
 
         with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
-            from stt.whisper_engine import WhisperEngine
-            engine = WhisperEngine(model_size="base", language="en")
+            first = WhisperEngine(model_size="base", language="en")
+            second = WhisperEngine(model_size="base", language="de")
 
-        return engine, mock_model
+        assert mock_fw.WhisperModel.call_count == 1
+        assert first._model is second._model
 
-    def test_engine_loads_successfully(self):
-        engine, _ = self._make_engine()
-        assert engine.is_loaded() is True
+    def test_warmup_runs_once_per_model(self):
+        mock_fw = MagicMock()
+        mock_model = mock_fw.WhisperModel.return_value
+        mock_model.transcribe.return_value = ([], SimpleNamespace(language="en"))
+
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
+            WhisperEngine(model_size="base", language="en")
+            WhisperEngine(model_size="base", language="en")
+
+        mock_model.transcribe.assert_called_once()
+        assert mock_model.transcribe.call_args.kwargs["vad_filter"] is False
+
+    def test_warmup_builds_peak_kernel(self):
+        mock_fw = MagicMock()
+        mock_fw.WhisperModel.return_value.transcribe.return_value = ([], SimpleNamespace(language="en"))
+
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw}), \
+                patch("stt.whisper_engine._peak_amplitude", wraps=_peak_amplitude) as peak:
+            WhisperEngine(model_size="base", language="en")
+
+        peak.assert_called_once()
+
+    def test_batched_pipeline_used_when_batch_size_gt_1(self):
+        mock_fw = MagicMock()
+        mock_pipeline = mock_fw.BatchedInferencePipeline.return_value
+        mock_pipeline.transcribe.return_value = ([], SimpleNamespace(language="en"))
+
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
+            engine = WhisperEngine(model_size="base", language="en", batch_size=8, warmup=False)
+
+        engine.transcribe(np.full(16000, 0.1, dtype=np.float32))
+
+        mock_pipeline.transcribe.assert_called_once()
+        assert mock_pipeline.transcribe.call_args.kwargs["batch_size"] == 8
+        mock_fw.WhisperModel.return_value.transcribe.assert_not_called()
 
     def test_engine_load_failure(self):
         mock_fw = MagicMock()
         mock_fw.WhisperModel.side_effect = RuntimeError("model not found")
 
         with patch.dict("sys.modules", {"faster_whisper": mock_fw}):
-            from stt.whisper_engine import WhisperEngine
             with pytest.raises(STTEngineError, match="Failed to load Whisper model"):
                 WhisperEngine(model_size="base", language="en")
 
-    def test_transcribe_returns_correct_format(self):
-        engine, mock_model = self._make_engine()
-
-        seg1 = MagicMock()
-        seg1.text = "Hello world"
-        seg1.avg_logprob = -0.3
-
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model.transcribe.return_value = ([seg1], mock_info)
-
-        audio = np.zeros(16000, dtype=np.float32)
-        result = engine.transcribe(audio)
+    def _load_with_ct2(self, cuda_devices, supported):
+        """Construct a WhisperEngine against a mocked ctranslate2 capability probe."""
+        mock_fw = MagicMock()
+        mock_ct2 = MagicMock()
+        mock_ct2.get_cuda_device_count.return_value = cuda_devices
+        mock_ct2.get_supported_compute_types.return_value = set(supported)
+
+        with patch.dict("sys.modules", {"faster_whisper": mock_fw, "ctranslate2": mock_ct2}):
+            WhisperEngine(model_size="base", language="en")
+
+        return mock_fw.WhisperModel.call_args
+
+    def test_compute_type_int8_on_cpu(self):
+        call = self._load_with_ct2(0, {"float32", "int8", "int8_float32"})
+        assert call.kwargs == {"device": "cpu", "compute_type": "int8"}
+
+    def test_compute_type_int8_float16_on_tensor_core_gpu(self):
+        call = self._load_with_ct2(1, {"float32", "float16", "int8_float16"})
+        assert call.kwargs == {"device": "cuda", "compute_type": "int8_float16"}
+
+    def test_compute_type_float16_on_gpu_without_int8(self):
+        call = self._load_with_ct2(1, {"float32", "float16"})
+        assert call.kwargs == {"device": "cuda", "compute_type": "float16"}
+
+    @pytest.mark.parametrize("segs, text, confidence", [
+        ((("Hello world", -0.3),), "Hello world", math.exp(-0.3)),
+        # Confidence is exp of the mean avg_logprob across segments
+        ((("Hello ", -0.2), ("world", -0.4)), "Hello world", math.exp(-0.3)),
+        ((), "", 0.0),
+        (((" Hello ", -0.1), ("world ", -0.1)), "Hello world", math.exp(-0.1)),
+        # exp(0.5) > 1.0 is clamped
+        ((("Hello", 0.5),), "Hello", 1.0),
+    ], ids=["single", "mean-logprob", "no-segments", "joined", "clamped"])
+    def test_transcribe_result(self, whisper, segs, text, confidence):
+        engine, mock_model = whisper
+        segments = [SimpleNamespace(text=t, avg_logprob=lp) for t, lp in segs]
+        mock_model.transcribe.return_value = (segments, SimpleNamespace(language="en"))
+
+        result = engine.transcribe(np.full(16000, 0.1, dtype=np.float32))
 
         assert isinstance(result, TranscriptionResult)
-        assert result.text == "Hello world"
+        assert result.text == text
+        assert result.confidence == pytest.approx(confidence, abs=1e-6)
         assert result.language == "en"
         assert result.transcription_ms > 0
 
-    def test_transcribe_confidence_computation(self):
-        """Confidence should be exp(avg_logprob) averaged across segments."""
-        engine, mock_model = self._make_engine()
-
-        seg1 = MagicMock()
-        seg1.text = "Hello "
-        seg1.avg_logprob = -0.2
-
-        seg2 = MagicMock()
-        seg2.text = "world"
-        seg2.avg_logprob = -0.4
-
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model.transcribe.return_value = ([seg1, seg2], mock_info)
+    def test_transcribe_vad_filter_enabled_by_default(self, whisper):
+        engine, mock_model = whisper
+        mock_model.transcribe.return_value = ([], SimpleNamespace(language="en"))
 
-        audio = np.zeros(16000, dtype=np.float32)
-        result = engine.transcribe(audio)
+        engine.transcribe(np.full(16000, 0.1, dtype=np.float32))
 
-        expected_avg = (-0.2 + -0.4) / 2  # -0.3
-        expected_confidence = math.exp(expected_avg)
-        assert abs(result.confidence - expected_confidence) < 1e-6
+        kwargs = mock_model.transcribe.call_args.kwargs
+        assert kwargs["vad_filter"] is True
+        assert kwargs["vad_parameters"] == {"min_silence_duration_ms": 500}
 
-    def test_transcribe_no_segments(self):
-        """Empty segments should return empty text and 0.0 confidence."""
-        engine, mock_model = self._make_engine()
+    def test_transcribe_skips_silent_audio(self, whisper):
+        """Silent input should short-circuit without running the model."""
+        engine, mock_model = whisper
 
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model.transcribe.return_value = ([], mock_info)
-
-        audio = np.zeros(16000, dtype=np.float32)
-        result = engine.transcribe(audio)
+        result = engine.transcribe(SILENCE_16K)
 
+        mock_model.transcribe.assert_not_called()
         assert result.text == ""
         assert result.confidence == 0.0
+        assert result.language == "en"
 
-    def test_transcribe_not_loaded(self):
-        engine, _ = self._make_engine()
-        engine._loaded = False
+    def test_transcribe_passes_float32_through_without_copy(self, whisper):
+        engine, mock_model = whisper
+        mock_model.transcribe.return_value = ([], SimpleNamespace(language="en"))
 
-        audio = np.zeros(16000, dtype=np.float32)
-        with pytest.raises(STTEngineError, match="not loaded"):
-            engine.transcribe(audio)
+        audio = np.full(16000, 0.1, dtype=np.float32)
+        engine.transcribe(audio)
 
-    def test_transcribe_joins_multiple_segments(self):
-        engine, mock_model = self._make_engine()
+        assert mock_model.transcribe.call_args[0][0] is audio
 
-        seg1 = MagicMock()
-        seg1.text = " Hello "
-        seg1.avg_logprob = -0.1
+    def test_transcribe_converts_non_float32(self, whisper):
+        engine, mock_model = whisper
+        mock_model.transcribe.return_value = ([], SimpleNamespace(language="en"))
 
-        seg2 = MagicMock()
-        seg2.text = "world "
-        seg2.avg_logprob = -0.1
+        engine.transcribe(np.full(16000, 0.1, dtype=np.float64))
 
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model.transcribe.return_value = ([seg1, seg2], mock_info)
+        passed = mock_model.transcribe.call_args[0][0]
+        assert passed.dtype == np.float32
+        assert passed.flags["C_CONTIGUOUS"]
 
-        audio = np.zeros(16000, dtype=np.float32)
-        result = engine.transcribe(audio)
+    def test_transcribe_rejects_multichannel(self, whisper):
+        engine, _ = whisper
+        with pytest.raises(STTEngineError, match="1-D"):
+            engine.transcribe(np.full((16000, 2), 0.1, dtype=np.float32))
 
-        assert result.text == "Hello world"
+    async def test_atranscribe_runs_off_event_loop(self, whisper):
+        engine, mock_model = whisper
+        seen_threads = []
 
-    def test_transcribe_confidence_clamped(self):
-        """Confidence should be clamped to [0.0, 1.0]."""
-        engine, mock_model = self._make_engine()
+        def fake_transcribe(audio, **kwargs):
+            seen_threads.append(threading.current_thread())
+            return [], SimpleNamespace(language="en")
 
-        seg1 = MagicMock()
-        seg1.text = "Hello"
-        seg1.avg_logprob = 0.5  # exp(0.5) > 1.0
+        mock_model.transcribe.side_effect = fake_transcribe
+        result = await engine.atranscribe(np.full(16000, 0.1, dtype=np.float32))
 
-        mock_info = MagicMock()
-        mock_info.language = "en"
-        mock_model.transcribe.return_value = ([seg1], mock_info)
+        assert isinstance(result, TranscriptionResult)
+        assert seen_threads and seen_threads[0] is not threading.main_thread()
+
+    def test_peak_amplitude_uses_absolute_value(self):
+        audio = np.array([0.1, -0.5, 0.2], dtype=np.float32)
+        assert _peak_amplitude(audio) == pytest.approx(0.5)
 
-        audio = np.zeros(16000, dtype=np.float32)
-        result = engine.transcribe(audio)
+    def test_transcribe_not_loaded(self, whisper):
+        engine, _ = whisper
+        engine._loaded = False
 
-        assert result.confidence == 1.0
+        with pytest.raises(STTEngineError, match="not loaded"):
+            engine.transcribe(SILENCE_16K)
 
 
 # ─── VoiceActivityDetector Tests ─────────────────────────────────────────────
@@ -159,15 +252,15 @@ class TestVoiceActivityDetector:
         mock_ort = MagicMock()
         mock_session = MagicMock()
         # session.run returns [output, new_state]
-        mock_session.run.return_value = [
-            np.array([[speech_prob]], dtype=np.float32),
-            np.zeros((2, 1, 128), dtype=np.float32),
-        ]
+        if speech_prob not in _VAD_PROB_CACHE:
+            prob = np.array([[speech_prob]], dtype=np.float32)
+            prob.setflags(write=False)
+            _VAD_PROB_CACHE[speech_prob] = prob
+        mock_session.run.return_value = [_VAD_PROB_CACHE[speech_prob], _ZERO_VAD_STATE]
         mock_ort.InferenceSession.return_value = mock_session
 
         with patch.dict("sys.modules", {"onnxruntime": mock_ort}):
             with patch("stt.vad.VoiceActivityDetector._find_model", return_value="/fake/silero_vad.onnx"):
-                from stt.vad import VoiceActivityDetector
                 vad = VoiceActivityDetector()
 
         return vad, mock_session
@@ -176,30 +269,47 @@ class TestVoiceActivityDetector:
         vad, _ = self._make_vad()
         assert vad.is_loaded() is True
 
+    def test_vad_warms_up_session_on_load(self):
+        vad, mock_session = self._make_vad()
+        assert mock_session.run.call_count == 1
+        inputs = mock_session.run.call_args[0][1]
+        assert inputs["input"].shape == (1, 576)
+        # Warm-up must not leak into the detector state
+        assert np.array_equal(vad._state, _ZERO_VAD_STATE)
+
     def test_vad_load_failure(self):
         mock_ort = MagicMock()
         with patch.dict("sys.modules", {"onnxruntime": mock_ort}):
             with patch("stt.vad.VoiceActivityDetector._find_model", return_value=None):
-                from stt.vad import VoiceActivityDetector
                 with pytest.raises(VADError, match="not found"):
                     VoiceActivityDetector()
 
+    def test_find_model_prefers_int8(self, tmp_path):
+        (tmp_path / "silero_vad.onnx").write_bytes(b"")
+        (tmp_path / "silero_vad_int8.onnx").write_bytes(b"")
+
+        with patch.dict("sys.modules", {"silero_vad": None}):
+            with patch("stt.vad._MODEL_DIRS", [str(tmp_path)]):
+                path = VoiceActivityDetector._find_model()
+
+        assert path == str(tmp_path / "silero_vad_int8.onnx")
+
     def test_is_speech_returns_bool_true(self):
         vad, _ = self._make_vad(speech_prob=0.8)
-        chunk = np.zeros(512, dtype=np.float32)
+        chunk = _SILENT_CHUNK_512
         result = vad.is_speech(chunk)
         assert isinstance(result, bool)
         assert result is True
 
     def test_is_speech_returns_bool_false(self):
         vad, _ = self._make_vad(speech_prob=0.1)
-        chunk = np.zeros(512, dtype=np.float32)
+        chunk = _SILENT_CHUNK_512
         result = vad.is_speech(chunk)
         assert result is False
 
     def test_speech_probability_returns_float(self):
         vad, _ = self._make_vad(speech_prob=0.65)
-        chunk = np.zeros(512, dtype=np.float32)
+        chunk = _SILENT_CHUNK_512
         prob = vad.speech_probability(chunk)
         assert isinstance(prob, float)
         assert 0.0 <= prob <= 1.0
@@ -207,21 +317,19 @@ class TestVoiceActivityDetector:
 
     def test_speech_probability_with_bytes(self):
         vad, _ = self._make_vad(speech_prob=0.7)
-        chunk_array = np.zeros(512, dtype=np.float32)
-        chunk_bytes = chunk_array.tobytes()
-        prob = vad.speech_probability(chunk_bytes)
+        prob = vad.speech_probability(_SILENT_CHUNK_512_BYTES)
         assert isinstance(prob, float)
 
     def test_reset(self):
         vad, _ = self._make_vad()
         vad.reset()
         # After reset, state should be zeros
-        assert np.allclose(vad._state, np.zeros((2, 1, 128), dtype=np.float32))
+        assert not vad._state.any()
 
     def test_not_loaded_raises(self):
         vad, _ = self._make_vad()
         vad._loaded = False
-        chunk = np.zeros(512, dtype=np.float32)
+        chunk = _SILENT_CHUNK_512
         with pytest.raises(VADError, match="not loaded"):
             vad.speech_probability(chunk)
 
@@ -229,52 +337,54 @@ class TestVoiceActivityDetector:
 # ─── MicCapture Tests ────────────────────────────────────────────────────────
 
 
+class _FakeInputStream:
+    """Stand-in for sounddevice.InputStream; on_start runs when the stream starts."""
+
+    def __init__(self):
+        self.on_start = None
+
+    def start(self):
+        if self.on_start:
+            self.on_start()
+
+    def stop(self):
+        pass
+
+    def close(self):
+        pass
+
+
 class TestMicCapture:
     """Tests for MicCapture recording."""
 
     def test_initial_state(self):
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         assert mic.is_recording is False
 
     def _mock_sounddevice(self):
-        """Create a mock sounddevice module and inject it into sys.modules."""
-        mock_sd = MagicMock()
-        mock_stream = MagicMock()
-        mock_sd.InputStream.return_value = mock_stream
-        return mock_sd, mock_stream
+        """Create a stub sounddevice module to inject into sys.modules."""
+        stream = _FakeInputStream()
+        return SimpleNamespace(InputStream=lambda **kwargs: stream), stream
 
-    @pytest.mark.asyncio
     async def test_record_timeout_returns_none(self):
         """Recording with no speech should return None after timeout."""
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         mock_vad = MagicMock()
         mock_vad.is_speech.return_value = False
 
-        mock_sd, _ = self._mock_sounddevice()
+        mock_sd, stream = self._mock_sounddevice()
+        # record() swaps in a fresh queue, so fill it as the stream starts
+        silent_chunk = _SILENT_CHUNK_512.reshape(512, 1)
+        stream.on_start = lambda: [mic._audio_queue.put(silent_chunk) for _ in range(5)]
 
         with patch.dict("sys.modules", {"sounddevice": mock_sd}):
-            # Put some silent chunks in the queue, then let it timeout
-            async def feed_silence():
-                await asyncio.sleep(0.05)
-                for _ in range(5):
-                    mic._audio_queue.put(np.zeros((512, 1), dtype=np.float32))
-
-            task = asyncio.create_task(feed_silence())
-            result = await mic.record(vad=mock_vad, timeout=0.5, silence_threshold=0.3)
-            await task
+            result = await mic.record(vad=mock_vad, timeout=0.1, silence_threshold=0.3)
 
         assert result is None
         assert mic.is_recording is False
 
-    @pytest.mark.asyncio
     async def test_record_with_cancellation(self):
         """Recording should return None when cancel_event is set."""
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         mock_vad = MagicMock()
         mock_vad.is_speech.return_value = False
@@ -283,24 +393,16 @@ class TestMicCapture:
         mock_sd, _ = self._mock_sounddevice()
 
         with patch.dict("sys.modules", {"sounddevice": mock_sd}):
-            async def cancel_soon():
-                await asyncio.sleep(0.1)
-                cancel_event.set()
-
-            task = asyncio.create_task(cancel_soon())
+            asyncio.get_running_loop().call_later(0.02, cancel_event.set)
             result = await mic.record(
                 vad=mock_vad, timeout=10, cancel_event=cancel_event
             )
-            await task
 
         assert result is None
         assert mic.is_recording is False
 
-    @pytest.mark.asyncio
     async def test_record_concurrent_call_protection(self):
         """Second record call should raise MicCaptureError if already recording."""
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         mic._recording = True
 
@@ -308,11 +410,8 @@ class TestMicCapture:
         with pytest.raises(MicCaptureError, match="Another recording"):
             await mic.record(vad=mock_vad)
 
-    @pytest.mark.asyncio
     async def test_record_with_speech_and_silence(self):
         """Recording should capture speech and stop after silence threshold."""
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture(sample_rate=16000)
 
         # VAD returns True for first 3 chunks (speech), then False (silence)
@@ -329,40 +428,37 @@ class TestMicCapture:
         mock_sd, _ = self._mock_sounddevice()
 
         with patch.dict("sys.modules", {"sounddevice": mock_sd}):
-            # Each chunk is 1600 samples at 16kHz = 0.1s
+            # Each chunk is 1600 samples at 16kHz = 0.1s. The queue has no
+            # backpressure, so deliver them in one burst after the stream opens.
             async def feed_audio():
                 await asyncio.sleep(0.05)
-                for _ in range(20):
-                    mic._audio_queue.put(
-                        np.random.randn(1600, 1).astype(np.float32)
-                    )
-                    await asyncio.sleep(0.01)
+                for chunk in _MIC_TEST_CHUNKS:
+                    mic._audio_queue.put(chunk)
+                await asyncio.sleep(0)
 
             task = asyncio.create_task(feed_audio())
             result = await mic.record(
-                vad=mock_vad, timeout=5, silence_threshold=0.5
+                vad=mock_vad, timeout=1, silence_threshold=0.5
             )
             await task
 
         assert result is not None
         assert isinstance(result, np.ndarray)
         assert result.ndim == 1
+        assert result.dtype == np.float32
         assert mic.is_recording is False
 
     def test_stop_sets_flag(self):
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         mic.stop()
         assert mic._stop_flag is True
 
     def test_audio_callback(self):
-        from stt.mic_capture import MicCapture
-
         mic = MicCapture()
         indata = np.ones((512, 1), dtype=np.float32)
         mic._audio_callback(indata, 512, None, None)
 
         assert not mic._audio_queue.empty()
         queued = mic._audio_queue.get()
+        assert queued.dtype == np.float16
         np.testing.assert_array_equal(queued, indata)
@@ -1,9 +1,13 @@
 """Tests for the TTS subsystem."""
 
 import asyncio
+import subprocess
 import sys
+import threading
+import time
+import wave
 from pathlib import Path
-from unittest.mock import patch, MagicMock
+from unittest.mock import ANY, patch, MagicMock
 
 import numpy as np
 import pytest
@@ -19,37 +23,94 @@ from shared import (
     AudioPlayerError,
     ALL_VOICE_IDS,
 )
+from tts.audio_player import AudioPlayer, _to_pcm16
+from tts.kokoro_engine import KokoroEngine
+from tts.speech_queue import SpeechQueue, _split_sentences
 
 
 # ─── Fixtures ────────────────────────────────────────────────────────────────
 
+# 1 second of silence at 24kHz, shared read-only by the fixtures below
+_SILENT_SAMPLES_24K = np.zeros(24000, dtype=np.float32)
+_SILENT_SAMPLES_24K.setflags(write=False)
 
-@pytest.fixture
+# Shared default results; both dataclasses are frozen so sharing is safe
+_SYNTH_OK = SynthesisResult(
+    samples=_SILENT_SAMPLES_24K,
+    sample_rate=24000,
+    duration_ms=1000.0,
+    synthesis_ms=100.0,
+)
+_PLAY_OK = PlaybackResult(success=True, duration_ms=1000.0)
+
+
+def _configure_kokoro_model(mock_model):
+    """Give a mock Kokoro model its default create() behaviour."""
+    mock_model.create.return_value = (_SILENT_SAMPLES_24K, 24000)
+
+
+def _configure_speech_mocks(mock_engine, mock_player):
+    """Give the SpeechQueue's mock engine and player their default behaviour."""
+    mock_engine.synthesize_into.return_value = _SYNTH_OK
+    mock_player.play.return_value = _PLAY_OK
+    # Per-chunk play() by default; streaming tests opt in
+    mock_player.open_stream.return_value = False
+    mock_player.write.return_value = True
+    mock_player.close_stream.return_value = _PLAY_OK
+
+
+@pytest.fixture(autouse=True)
+def _reset_module_fixtures(request):
+    """Restore any module-scoped fixture the test used to its initial state.
+
+    Fixtures below are built once per module; tests may mutate mock return
+    values, side effects and a few private attributes, so undo that here.
+    """
+    yield
+    names = request.fixturenames
+    if "mock_kokoro_module" in names:
+        _, mock_model = request.getfixturevalue("mock_kokoro_module")
+        mock_model.reset_mock(return_value=True, side_effect=True)
+        _configure_kokoro_model(mock_model)
+    if "kokoro_engine" in names:
+        engine, _ = request.getfixturevalue("kokoro_engine")
+        engine._loaded = True
+        engine._synth_cache.clear()
+        engine._synth_cache_samples = 0
+    if "audio_player" in names:
+        player = request.getfixturevalue("audio_player")
+        player._process = None
+        player._expected_end = 0.0
+    if "speech_queue" in names:
+        _, mock_engine, mock_player = request.getfixturevalue("speech_queue")
+        mock_engine.reset_mock(return_value=True, side_effect=True)
+        mock_player.reset_mock(return_value=True, side_effect=True)
+        _configure_speech_mocks(mock_engine, mock_player)
+
+
+@pytest.fixture(scope="module")
 def mock_kokoro_module():
     """Provide a mocked kokoro_onnx module with a working model."""
     mock_module = MagicMock()
     mock_model = MagicMock()
-    samples = np.zeros(24000, dtype=np.float32)  # 1 second at 24kHz
-    mock_model.create.return_value = (samples, 24000)
+    _configure_kokoro_model(mock_model)
     mock_module.Kokoro.return_value = mock_model
     return mock_module, mock_model
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def kokoro_engine(mock_kokoro_module):
     """Create a KokoroEngine with mocked kokoro_onnx."""
     mock_module, mock_model = mock_kokoro_module
     with patch.dict("sys.modules", {"kokoro_onnx": mock_module}):
-        from tts.kokoro_engine import KokoroEngine
         engine = KokoroEngine("fake_model.onnx", "fake_voices.bin")
     return engine, mock_model
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def audio_player():
     """Create an AudioPlayer with command existence mocked."""
     with patch("tts.audio_player.AudioPlayer._command_exists", return_value=True):
-        from tts.audio_player import AudioPlayer
         player = AudioPlayer("mpv")
         player._config_path_override = ""  # Skip live config reads in tests
     return player
@@ -67,33 +128,21 @@ def mock_popen():
         yield mock_cls, mock_proc
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def speech_queue():
     """Create a SpeechQueue with mocked engine and player."""
     mock_engine = MagicMock()
     mock_player = MagicMock()
+    _configure_speech_mocks(mock_engine, mock_player)
 
-    samples = np.zeros(24000, dtype=np.float32)
-    mock_engine.synthesize.return_value = SynthesisResult(
-        samples=samples,
-        sample_rate=24000,
-        duration_ms=1000.0,
-        synthesis_ms=100.0,
-    )
-    mock_player.play.return_value = PlaybackResult(
-        success=True,
-        duration_ms=1000.0,
-    )
-
-    from tts.speech_queue import SpeechQueue
     queue = SpeechQueue(mock_engine, mock_player)
     return queue, mock_engine, mock_player
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def audio_samples():
-    """Provide a 1-second numpy audio sample array."""
-    return np.zeros(24000, dtype=np.float32)
+    """Provide a read-only 1-second numpy audio sample array."""
+    return _SILENT_SAMPLES_24K
 
 
 # ─── KokoroEngine Tests ─────────────────────────────────────────────────────
@@ -141,7 +190,6 @@ class TestKokoroEngine:
         mock_kokoro.Kokoro.side_effect = RuntimeError("Model file not found")
 
         with patch.dict("sys.modules", {"kokoro_onnx": mock_kokoro}):
-            from tts.kokoro_engine import KokoroEngine
             with pytest.raises(TTSEngineError, match="Failed to load"):
                 KokoroEngine("bad_path.onnx", "bad_voices.bin")
 
@@ -185,7 +233,6 @@ class TestKokoroEngine:
         mock_model.create.return_value = (samples, 24000)
 
         with patch.dict("sys.modules", {"kokoro_onnx": mock_module}):
-            from tts.kokoro_engine import KokoroEngine
             engine = KokoroEngine("fake.onnx", "fake.bin")
 
         result = engine.synthesize("Long text", "am_eric")
@@ -199,6 +246,60 @@ class TestKokoroEngine:
         with pytest.raises(TTSEngineError, match="Synthesis failed"):
             engine.synthesize("Hello", "am_eric")
 
+    def test_repeated_synthesis_served_from_cache(self, kokoro_engine):
+        engine, mock_model = kokoro_engine
+
+        first = engine.synthesize("Yes, sir.", "am_eric", speed=1.0)
+        second = engine.synthesize("Yes, sir.", "am_eric", speed=1.0)
+
+        mock_model.create.assert_called_once()
+        assert second.synthesis_ms == 0.0
+        assert np.array_equal(second.samples, first.samples)
+
+    def test_cache_keyed_on_voice_and_speed(self, kokoro_engine):
+        engine, mock_model = kokoro_engine
+
+        engine.synthesize("Yes, sir.", "am_eric", speed=1.0)
+        engine.synthesize("Yes, sir.", "af_nova", speed=1.0)
+        engine.synthesize("Yes, sir.", "am_eric", speed=1.5)
+
+        assert mock_model.create.call_count == 3
+
+    def test_cache_evicts_least_recently_used(self, kokoro_engine):
+        engine, mock_model = kokoro_engine
+        with patch("tts.kokoro_engine._SYNTH_CACHE_MAX_SAMPLES", 2 * 24000):
+            engine.synthesize("one", "am_eric")
+            engine.synthesize("two", "am_eric")
+            engine.synthesize("one", "am_eric")  # hit; "two" is now oldest
+            engine.synthesize("three", "am_eric")
+
+        assert [key[0] for key in engine._synth_cache] == ["one", "three"]
+        assert mock_model.create.call_count == 3
+
+    def test_synthesize_into_writes_padded_samples_into_buffer(self, kokoro_engine):
+        engine, mock_model = kokoro_engine
+        mock_model.create.return_value = (np.ones(1000, dtype=np.float32), 24000)
+        out = np.full(24000, 9.0, dtype=np.float32)
+
+        result = engine.synthesize_into("Hello", "am_eric", 1.0, out)
+
+        # 3600 head + 1000 speech + 2400 tail, viewed in place
+        assert np.shares_memory(result.samples, out)
+        assert len(result.samples) == 7000
+        assert not result.samples[:3600].any()
+        assert (result.samples[3600:4600] == 1.0).all()
+        assert not result.samples[4600:].any()
+        assert out[7000] == 9.0
+
+    def test_synthesize_into_allocates_when_buffer_too_small(self, kokoro_engine):
+        engine, _ = kokoro_engine
+        out = np.empty(100, dtype=np.float32)
+
+        result = engine.synthesize_into("Hello", "am_eric", 1.0, out)
+
+        assert not np.shares_memory(result.samples, out)
+        assert len(result.samples) == 24000 + 3600 + 2400
+
 
 # ─── AudioPlayer Tests ──────────────────────────────────────────────────────
 
@@ -206,22 +307,38 @@ class TestKokoroEngine:
 class TestAudioPlayer:
     """Tests for AudioPlayer."""
 
-    def test_play_writes_temp_file_and_cleans_up(self, audio_player, audio_samples, mock_popen):
+    def test_play_streams_raw_float_pcm_to_mpv(self, audio_player, audio_samples, mock_popen):
         mock_cls, mock_proc = mock_popen
         result = audio_player.play(audio_samples, 24000)
 
         assert isinstance(result, PlaybackResult)
         assert result.success is True
-        assert result.duration_ms >= 0
+        assert result.duration_ms == 1000.0  # audio length, not wall time
 
-        # Verify Popen was called with mpv command
+        # mpv reads headerless float32 from stdin; nothing is written to disk
         call_args = mock_cls.call_args[0][0]
-        assert call_args[0] == "mpv"
-        assert call_args[1] == "--no-terminal"
-        assert call_args[2] == "--no-video"
-        assert call_args[3].endswith(".wav")
-        # Temp file should have been cleaned up
-        assert not Path(call_args[3]).exists()
+        assert call_args == [
+            "mpv", "--no-terminal", "--no-video",
+            "--demuxer=rawaudio", "--demuxer-rawaudio-rate=24000",
+            "--demuxer-rawaudio-format=floatle", "--demuxer-rawaudio-channels=1", "-",
+        ]
+        assert mock_cls.call_args.kwargs["stdin"] == subprocess.PIPE
+        sent = mock_proc.communicate.call_args[0][0]
+        assert np.array_equal(np.frombuffer(sent, dtype="<f4"), audio_samples)
+
+    def test_play_streams_raw_float_pcm_to_aplay(self, audio_samples, mock_popen):
+        mock_cls, mock_proc = mock_popen
+        with patch("tts.audio_player.AudioPlayer._command_exists", return_value=True):
+            player = AudioPlayer("aplay")
+
+        player.play(audio_samples, 24000)
+
+        assert mock_cls.call_args[0][0] == [
+            "aplay", "-q", "-t", "raw", "-f", "FLOAT_LE", "-r", "24000", "-c", "1", "-",
+        ]
+        assert mock_cls.call_args.kwargs["stdin"] == subprocess.PIPE
+        sent = mock_proc.communicate.call_args[0][0]
+        assert np.array_equal(np.frombuffer(sent, dtype="<f4"), audio_samples)
 
     def test_play_reports_failure_on_nonzero_exit(self, audio_player, audio_samples, mock_popen):
         mock_cls, mock_proc = mock_popen
@@ -232,15 +349,91 @@ class TestAudioPlayer:
         assert result.success is False
         assert "exited with code 1" in result.error
 
-    def test_play_cleans_up_temp_file_on_failure(self, audio_player, audio_samples, mock_popen):
+    def test_play_afplay_reuses_one_temp_file_until_close(self, audio_samples, mock_popen):
         mock_cls, mock_proc = mock_popen
-        mock_proc.returncode = 1
+        seen = []
 
-        audio_player.play(audio_samples, 24000)
+        def read_wav(cmd, **kwargs):
+            with wave.open(cmd[1], "rb") as wav:
+                seen.append((wav.getnchannels(), wav.getsampwidth(), wav.getframerate(), wav.getnframes()))
+            return mock_proc
 
-        # Temp file should still be cleaned up even on failure
-        call_args = mock_cls.call_args[0][0]
-        assert not Path(call_args[3]).exists()
+        mock_cls.side_effect = read_wav
+        with patch("tts.audio_player.AudioPlayer._command_exists", return_value=True):
+            player = AudioPlayer("afplay")
+
+        player.play(audio_samples, 24000)
+        player.play(audio_samples[:100], 24000)
+
+        # afplay can't read stdin, so every clip overwrites the same temp WAV
+        assert seen == [(1, 2, 24000, len(audio_samples)), (1, 2, 24000, 100)]
+        first_path, second_path = (c[0][0][1] for c in mock_cls.call_args_list)
+        assert first_path == second_path == player._tmp_wav_path
+        assert first_path.endswith(".wav")
+        assert mock_proc.wait.call_count == 2
+
+        player.close()
+        assert not Path(first_path).exists()
+
+    def test_stream_plays_chunks_through_one_process(self, audio_player, audio_samples, mock_popen):
+        mock_cls, mock_proc = mock_popen
+        mock_proc.stdin.write.side_effect = len  # unbuffered pipe took every byte
+
+        assert audio_player.open_stream(24000) is True
+        assert audio_player.write(audio_samples) is True
+        assert audio_player.write(audio_samples) is True
+        assert audio_player.is_playing is True
+        result = audio_player.close_stream()
+
+        assert result.success is True
+        assert result.duration_ms == 2000.0  # two 1 s chunks
+        mock_cls.assert_called_once()
+        assert "--demuxer=rawaudio" in mock_cls.call_args[0][0]
+        assert mock_cls.call_args.kwargs["bufsize"] == 0
+        assert mock_proc.stdin.write.call_count == 2
+        mock_proc.stdin.close.assert_called_once()
+        mock_proc.wait.assert_called_once()
+        assert audio_player._process is None
+
+    def test_stream_write_resumes_after_partial_write(self, audio_player, audio_samples, mock_popen):
+        _, mock_proc = mock_popen
+        mock_proc.stdin.write.side_effect = lambda view: min(len(view), 65536)
+
+        audio_player.open_stream(24000)
+        assert audio_player.write(audio_samples) is True
+        audio_player.close_stream()
+
+        sizes = [len(c.args[0]) for c in mock_proc.stdin.write.call_args_list]
+        assert sizes[0] == audio_samples.nbytes
+        assert sum(min(n, 65536) for n in sizes) == audio_samples.nbytes
+
+    def test_stream_write_fails_once_player_stopped(self, audio_player, audio_samples, mock_popen):
+        _, mock_proc = mock_popen
+        audio_player.open_stream(24000)
+        audio_player.stop()
+        mock_proc.returncode = -9
+
+        assert audio_player.write(audio_samples) is False
+        result = audio_player.close_stream()
+        assert result.success is False
+        assert "exited with code -9" in result.error
+
+    def test_open_stream_declined_for_afplay(self, mock_popen):
+        mock_cls, _ = mock_popen
+        with patch("tts.audio_player.AudioPlayer._command_exists", return_value=True):
+            player = AudioPlayer("afplay")
+
+        assert player.open_stream(24000) is False
+        mock_cls.assert_not_called()
+
+    def test_to_pcm16_clips_and_scales_float(self):
+        pcm = _to_pcm16(np.array([0.0, 0.5, 1.5, -2.0], dtype=np.float32))
+        assert pcm.dtype == np.int16
+        assert pcm.tolist() == [0, 16383, 32767, -32767]
+
+    def test_to_pcm16_passes_int16_through(self):
+        samples = np.array([1, -1, 300], dtype=np.int16)
+        assert _to_pcm16(samples) is samples
 
     def test_stop_kills_process(self, audio_player):
         mock_proc = MagicMock()
@@ -291,17 +484,28 @@ class TestAudioPlayer:
         mock_proc.poll.return_value = 0
         assert audio_player.is_playing is False
 
+    def test_is_playing_skips_poll_until_expected_end(self, audio_player):
+        mock_proc = MagicMock()
+        mock_proc.poll.return_value = 0
+        audio_player._process = mock_proc
+        audio_player._expected_end = time.monotonic() + 60
+        assert audio_player.is_playing is True
+        assert audio_player.is_playing is True
+        mock_proc.poll.assert_not_called()
+
+        audio_player._expected_end = time.monotonic() - 1
+        assert audio_player.is_playing is False
+        mock_proc.poll.assert_called_once()
+
     def test_fallback_to_afplay_on_macos(self):
         with patch("tts.audio_player.AudioPlayer._command_exists", side_effect=lambda cmd: cmd != "mpv"):
             with patch("platform.system", return_value="Darwin"):
-                from tts.audio_player import AudioPlayer
                 player = AudioPlayer("mpv")
                 assert player._player_command == "afplay"
 
     def test_fallback_to_aplay_on_linux(self):
         with patch("tts.audio_player.AudioPlayer._command_exists", side_effect=lambda cmd: cmd != "mpv"):
             with patch("platform.system", return_value="Linux"):
-                from tts.audio_player import AudioPlayer
                 player = AudioPlayer("mpv")
                 assert player._player_command == "aplay"
 
@@ -311,7 +515,6 @@ class TestAudioPlayer:
 
     def test_build_command_afplay(self):
         with patch("tts.audio_player.AudioPlayer._command_exists", return_value=True):
-            from tts.audio_player import AudioPlayer
             player = AudioPlayer("afplay")
         cmd = player._build_command("/tmp/test.wav")
         assert cmd == ["afplay", "/tmp/test.wav"]
@@ -328,81 +531,75 @@ class TestAudioPlayer:
 class TestSpeechQueueChunking:
     """Tests for SpeechQueue.chunk_text static method."""
 
-    def test_empty_text(self):
-        from tts.speech_queue import SpeechQueue
-        assert SpeechQueue.chunk_text("") == []
-
-    def test_short_text_single_chunk(self):
-        from tts.speech_queue import SpeechQueue
-        result = SpeechQueue.chunk_text("Hello world.", max_length=500)
-        assert result == ["Hello world."]
-
-    def test_text_under_max_length(self):
-        from tts.speech_queue import SpeechQueue
-        text = "Short sentence."
-        result = SpeechQueue.chunk_text(text, max_length=500)
-        assert result == [text]
-
-    def test_splits_on_period(self):
-        from tts.speech_queue import SpeechQueue
-        text = "First sentence. Second sentence. Third sentence."
-        result = SpeechQueue.chunk_text(text, max_length=35)
-        assert len(result) >= 2
-        for chunk in result:
-            assert len(chunk) > 0
-
-    def test_splits_on_exclamation(self):
-        from tts.speech_queue import SpeechQueue
-        text = "Wow! Amazing! Incredible!"
-        result = SpeechQueue.chunk_text(text, max_length=15)
-        assert len(result) >= 2
-
-    def test_splits_on_question_mark(self):
-        from tts.speech_queue import SpeechQueue
-        text = "What happened? Where are you? Are you okay?"
-        result = SpeechQueue.chunk_text(text, max_length=20)
-        assert len(result) >= 2
-
-    def test_mixed_punctuation(self):
-        from tts.speech_queue import SpeechQueue
-        text = "Wow! What happened? Let me check. All good."
-        result = SpeechQueue.chunk_text(text, max_length=25)
-        assert len(result) >= 2
-
-    def test_long_single_sentence_not_broken(self):
-        from tts.speech_queue import SpeechQueue
-        long_sentence = "A" * 600
-        result = SpeechQueue.chunk_text(long_sentence, max_length=500)
-        assert result == [long_sentence]
-
-    def test_multiple_sentences_grouped_under_limit(self):
-        from tts.speech_queue import SpeechQueue
-        text = "Short. Also short. And short."
-        result = SpeechQueue.chunk_text(text, max_length=500)
-        assert result == [text]
+    @pytest.mark.parametrize("text,max_length,expected", [
+        pytest.param("", 500, [], id="empty"),
+        pytest.param("Hello world.", 500, ["Hello world."], id="short-single-chunk"),
+        pytest.param(
+            "First sentence. Second sentence. Third sentence.", 35,
+            ["First sentence. Second sentence.", "Third sentence."],
+            id="splits-on-period",
+        ),
+        pytest.param(
+            "Wow! Amazing! Incredible!", 15,
+            ["Wow! Amazing!", "Incredible!"],
+            id="splits-on-exclamation",
+        ),
+        pytest.param(
+            "What happened? Where are you? Are you okay?", 20,
+            ["What happened?", "Where are you?", "Are you okay?"],
+            id="splits-on-question-mark",
+        ),
+        pytest.param(
+            "Wow! What happened? Let me check. All good.", 25,
+            ["Wow! What happened?", "Let me check. All good."],
+            id="mixed-punctuation",
+        ),
+        pytest.param("A" * 600, 500, ["A" * 600], id="long-sentence-not-broken"),
+        pytest.param(
+            "Short. Also short. And short.", 500,
+            ["Short. Also short. And short."],
+            id="grouped-under-limit",
+        ),
+        pytest.param("A" * 500, 500, ["A" * 500], id="exactly-at-max-length"),
+        pytest.param(
+            "First sentence. Second sentence. Third sentence. Fourth sentence.", 40,
+            ["First sentence. Second sentence.", "Third sentence. Fourth sentence."],
+            id="preserves-content",
+        ),
+    ])
+    def test_chunk_text(self, text, max_length, expected):
+        assert SpeechQueue.chunk_text(text, max_length=max_length) == expected
 
     def test_default_max_length_is_500(self):
-        from tts.speech_queue import SpeechQueue
         text = "A" * 400
         result = SpeechQueue.chunk_text(text)
         assert result == [text]
 
-    def test_exactly_at_max_length(self):
-        from tts.speech_queue import SpeechQueue
-        text = "A" * 500
-        result = SpeechQueue.chunk_text(text, max_length=500)
-        assert result == [text]
+    def test_repeated_text_served_from_cache(self):
+        text = "First sentence. Second sentence. Third sentence."
+        first = SpeechQueue.chunk_text(text, max_length=35)
+        hits = _split_sentences.cache_info().hits
 
-    def test_reconstructed_text_preserves_content(self):
-        """All original sentences should appear in the chunked output."""
-        from tts.speech_queue import SpeechQueue
-        text = "First sentence. Second sentence. Third sentence. Fourth sentence."
-        result = SpeechQueue.chunk_text(text, max_length=40)
-        joined = " ".join(result)
-        assert "First sentence." in joined
-        assert "Second sentence." in joined
-        assert "Third sentence." in joined
-        assert "Fourth sentence." in joined
+        second = SpeechQueue.chunk_text(text, max_length=35)
+
+        assert second == first
+        assert second is not first  # callers get their own list
+        assert _split_sentences.cache_info().hits == hits + 1
+
+    def test_non_ascii_text_split_on_character_boundaries(self):
+        text = "Café au lait. Naïve résumé! Über straße? Done."
+        result = SpeechQueue.chunk_text(text, max_length=20)
+        assert result == ["Café au lait.", "Naïve résumé!", "Über straße? Done."]
+
+    def test_lone_surrogate_does_not_break_splitting(self):
+        text = "Broken \ud83d emoji here. Second sentence!"
+        result = SpeechQueue.chunk_text(text, max_length=20)
+        assert result == ["Broken \ud83d emoji here.", "Second sentence!"]
+
+    def test_sentence_kernel_built_with_queue(self):
+        with patch("tts.speech_queue._sentence_ends") as sentence_ends:
+            SpeechQueue(MagicMock(), MagicMock())
+        sentence_ends.assert_called_once()
 
 
 # ─── SpeechQueue speak Tests ────────────────────────────────────────────────
@@ -411,7 +608,6 @@ class TestSpeechQueueChunking:
 class TestSpeechQueueSpeak:
     """Tests for SpeechQueue.speak (async)."""
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_returns_speak_result(self, speech_queue):
         queue, mock_engine, mock_player = speech_queue
 
@@ -424,7 +620,6 @@ class TestSpeechQueueSpeak:
         assert result.synthesis_ms > 0
         assert result.queued is False
 
-    @pytest.mark.asyncio
     async def test_speak_nonblocking_returns_queued(self, speech_queue):
         queue, _, _ = speech_queue
 
@@ -435,15 +630,14 @@ class TestSpeechQueueSpeak:
         assert result.queued is True
         assert result.voice == "am_eric"
 
-        # Give the background task a moment to run
-        await asyncio.sleep(0.1)
+        # The consumer task works through the queue in the background
+        await queue._queue.join()
+        assert queue.depth == 0
 
-    @pytest.mark.asyncio
     async def test_speak_nonblocking_does_not_wait(self, speech_queue):
         """Non-blocking speak should return nearly instantly."""
         queue, _, _ = speech_queue
 
-        import time
         start = time.perf_counter()
         result = await queue.speak("Hello world", "am_eric", block=False)
         elapsed_ms = (time.perf_counter() - start) * 1000
@@ -452,9 +646,8 @@ class TestSpeechQueueSpeak:
         # Should return in well under 100ms (no synthesis/playback wait)
         assert elapsed_ms < 100
 
-        await asyncio.sleep(0.1)
+        await queue._queue.join()
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_handles_playback_failure(self, speech_queue):
         queue, mock_engine, mock_player = speech_queue
         mock_player.play.return_value = PlaybackResult(
@@ -468,23 +661,20 @@ class TestSpeechQueueSpeak:
         assert result.success is False
         assert "Player crashed" in result.error
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_calls_engine_and_player(self, speech_queue):
         queue, mock_engine, mock_player = speech_queue
 
         await queue.speak("Test text", "am_eric", speed=1.2, block=True)
 
-        mock_engine.synthesize.assert_called_once_with("Test text", "am_eric", 1.2)
+        mock_engine.synthesize_into.assert_called_once_with("Test text", "am_eric", 1.2, ANY)
         mock_player.play.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_passes_speed_to_engine(self, speech_queue):
         queue, mock_engine, _ = speech_queue
 
         await queue.speak("Fast", "am_eric", speed=2.0, block=True)
-        mock_engine.synthesize.assert_called_with("Fast", "am_eric", 2.0)
+        mock_engine.synthesize_into.assert_called_with("Fast", "am_eric", 2.0, ANY)
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_auto_chunks_long_text(self, speech_queue):
         """Long text should be auto-chunked and each chunk synthesized separately."""
         queue, mock_engine, mock_player = speech_queue
@@ -498,11 +688,10 @@ class TestSpeechQueueSpeak:
 
         assert result.success is True
         # Engine should be called multiple times (once per chunk)
-        assert mock_engine.synthesize.call_count > 1
+        assert mock_engine.synthesize_into.call_count > 1
         # Player should be called the same number of times
-        assert mock_player.play.call_count == mock_engine.synthesize.call_count
+        assert mock_player.play.call_count == mock_engine.synthesize_into.call_count
 
-    @pytest.mark.asyncio
     async def test_speak_blocking_accumulates_timing(self, speech_queue):
         """Total timing should sum across chunks."""
         queue, mock_engine, mock_player = speech_queue
@@ -514,16 +703,142 @@ class TestSpeechQueueSpeak:
         assert result.synthesis_ms >= 100.0  # At least one chunk's worth
         assert result.duration_ms >= 1000.0
 
-    @pytest.mark.asyncio
     async def test_speak_handles_synthesis_exception(self, speech_queue):
         queue, mock_engine, _ = speech_queue
-        mock_engine.synthesize.side_effect = TTSEngineError("Engine failed")
+        mock_engine.synthesize_into.side_effect = TTSEngineError("Engine failed")
 
         result = await queue.speak("Hello", "am_eric", block=True)
 
         assert result.success is False
         assert "Engine failed" in result.error
 
+    async def test_consumer_survives_error_escaping_an_utterance(self, speech_queue):
+        queue, mock_engine, mock_player = speech_queue
+        mock_player.open_stream.return_value = True
+        # The second chunk fails to synthesize, then closing the stream on that
+        # error path raises too
+        mock_engine.synthesize_into.side_effect = [
+            _SYNTH_OK, TTSEngineError("Engine failed"), _SYNTH_OK,
+        ]
+        mock_player.close_stream.side_effect = [RuntimeError("player gone"), _PLAY_OK]
+        text = " ".join(f"This is sentence number {i}." for i in range(30))
+
+        with pytest.raises(RuntimeError, match="player gone"):
+            await queue.speak(text, "am_eric", block=True)
+        result = await asyncio.wait_for(queue.speak("Again", "am_eric", block=True), timeout=2)
+
+        assert result.success is True
+        assert queue.depth == 0
+
+    async def test_speak_alternates_scratch_buffers_per_chunk(self, speech_queue):
+        queue, mock_engine, _ = speech_queue
+        text = " ".join(f"This is sentence number {i}." for i in range(60))
+
+        await queue.speak(text, "am_eric", block=True)
+
+        calls = mock_engine.synthesize_into.call_args_list
+        assert len(calls) >= 3
+        for i, c in enumerate(calls):
+            assert c.args[3] is queue._scratch[i % 2]
+
+    async def test_next_chunk_synthesized_during_playback(self, speech_queue):
+        """Chunk 2's synthesis should start before chunk 1 finishes playing."""
+        queue, mock_engine, mock_player = speech_queue
+        events = []
+        playing = threading.Event()
+
+        def synthesize_into(text, voice_id, speed, out):
+            if events:  # every chunk after the first waits for playback to be under way
+                assert playing.wait(timeout=2)
+            events.append("synth")
+            return _SYNTH_OK
+
+        def play(samples, sample_rate):
+            events.append("play-start")
+            playing.set()
+            time.sleep(0.05)
+            playing.clear()
+            events.append("play-end")
+            return _PLAY_OK
+
+        mock_engine.synthesize_into.side_effect = synthesize_into
+        mock_player.play.side_effect = play
+
+        text = " ".join(f"This is sentence number {i}." for i in range(30))
+        result = await queue.speak(text, "am_eric", block=True)
+
+        assert result.success is True
+        assert events[:4] == ["synth", "play-start", "synth", "play-end"]
+
+    async def test_playback_runs_on_dedicated_thread(self, speech_queue):
+        queue, _, mock_player = speech_queue
+        threads = []
+
+        def play(samples, sample_rate):
+            threads.append(threading.current_thread().name)
+            return _PLAY_OK
+
+        mock_player.play.side_effect = play
+        await queue.speak("Hello", "am_eric", block=True)
+
+        assert threads[0].startswith("tts-play")
+
+    async def test_close_stops_playback_and_worker_threads(self):
+        mock_engine = MagicMock()
+        mock_player = MagicMock()
+        _configure_speech_mocks(mock_engine, mock_player)
+        queue = SpeechQueue(mock_engine, mock_player)
+
+        queue.close()
+
+        mock_player.stop.assert_called_once()
+        result = await queue.speak("Hello", "am_eric", block=True)
+        assert result.success is False
+
+    async def test_speak_plays_utterances_in_submission_order(self, speech_queue):
+        queue, mock_engine, _ = speech_queue
+
+        await queue.speak("First", "am_eric", block=False)
+        await queue.speak("Second", "af_heart", block=False)
+        assert queue.depth == 2
+        result = await queue.speak("Third", "am_eric", block=True)
+
+        assert result.success is True
+        assert [c.args[0] for c in mock_engine.synthesize_into.call_args_list] == [
+            "First", "Second", "Third",
+        ]
+        assert queue.depth == 0
+
+    async def test_speak_streams_chunks_through_one_player(self, speech_queue):
+        queue, mock_engine, mock_player = speech_queue
+        mock_player.open_stream.return_value = True
+        text = " ".join(f"This is sentence number {i}." for i in range(30))
+
+        result = await queue.speak(text, "am_eric", block=True)
+
+        assert result.success is True
+        assert result.duration_ms == _PLAY_OK.duration_ms
+        mock_player.open_stream.assert_called_once_with(24000)
+        assert mock_player.write.call_count == mock_engine.synthesize_into.call_count > 1
+        mock_player.close_stream.assert_called_once()
+        mock_player.play.assert_not_called()
+
+    async def test_speak_stream_stops_writing_after_player_dies(self, speech_queue):
+        queue, mock_engine, mock_player = speech_queue
+        mock_player.open_stream.return_value = True
+        mock_player.write.return_value = False
+        mock_player.close_stream.return_value = PlaybackResult(
+            success=False, duration_ms=10.0, error="Player exited with code -9"
+        )
+        text = " ".join(f"This is sentence number {i}." for i in range(30))
+
+        result = await queue.speak(text, "am_eric", block=True)
+
+        assert result.success is False
+        assert "code -9" in result.error
+        mock_player.write.assert_called_once()
+        mock_player.close_stream.assert_called_once()
+
     def test_stop_delegates_to_player(self, speech_queue):
         queue, _, mock_player = speech_queue
         mock_player.stop.return_value = True
@@ -541,6 +856,22 @@ class TestSpeechQueueSpeak:
 
         assert result is False
 
+    async def test_stop_drops_queued_utterances(self, speech_queue):
+        queue, mock_engine, mock_player = speech_queue
+        mock_player.stop.return_value = False
+        pending = [
+            asyncio.create_task(queue.speak(text, "am_eric", block=True))
+            for text in ("First", "Second")
+        ]
+        await asyncio.sleep(0)  # both are queued; the consumer hasn't started them
+
+        assert queue.stop() is True
+        results = await asyncio.gather(*pending)
+
+        assert [r.error for r in results] == ["Playback stopped"] * 2
+        assert queue.depth == 0
+        mock_engine.synthesize_into.assert_not_called()
+
     def test_depth_returns_zero_initially(self, speech_queue):
         queue, _, _ = speech_queue
         assert queue.depth == 0
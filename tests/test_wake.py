@@ -1,5 +1,6 @@
 """Tests for the wake word listener."""
 
+import os
 import sys
 import threading
 import time
@@ -12,89 +13,217 @@ import pytest
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from shared import STT_SAMPLE_RATE, TranscriptionResult
+from wake_listener import (
+    WakeWordListener, WakeState, _FrameRing, _SilenceGate, _lower_thread_priority,
+)
 
 
 # ─── WakeWordListener Tests ──────────────────────────────────────────────────
 
 
+class _StubSTT:
+    """Minimal WhisperEngine stand-in: every transcription hears "hello world"."""
+
+    _RESULT = TranscriptionResult(text="hello world", confidence=0.9, transcription_ms=200.0)
+
+    def transcribe(self, audio, sample_rate=STT_SAMPLE_RATE):
+        return self._RESULT
+
+
+class _StubVAD:
+    """Minimal VoiceActivityDetector stand-in that never hears speech."""
+
+    def reset(self):
+        pass
+
+    def is_speech(self, chunk):
+        return False
+
+
+# Mocked openwakeword tree shared by every listener in this module; call
+# state and any per-test configuration are reset after each test.
+_MOCK_OWW = MagicMock()
+_MOCK_WAKE_MODEL = _MOCK_OWW.model.Model.return_value
+
+
+@pytest.fixture(autouse=True)
+def _reset_shared_mocks():
+    yield
+    _MOCK_OWW.reset_mock()  # keeps Model.return_value wired to _MOCK_WAKE_MODEL
+    _MOCK_WAKE_MODEL.reset_mock(return_value=True, side_effect=True)
+
+
+def _make_listener(**kwargs):
+    """Build a WakeWordListener against the shared mocked openwakeword package."""
+    defaults = {
+        "stt_engine": _StubSTT(),
+        "vad": _StubVAD(),
+        "wake_model_name": "hey_jarvis_v0.1",
+        "threshold": 0.5,
+        "tmux_session": "agent-voice-test",
+        "ready_sound": None,
+        "recording_timeout": 10,
+        "no_speech_timeout": 5,
+    }
+    defaults.update(kwargs)
+
+    # openwakeword is imported lazily, so it only needs patching for construction
+    with patch.dict("sys.modules", {"openwakeword": _MOCK_OWW, "openwakeword.model": _MOCK_OWW.model}):
+        listener = WakeWordListener(**defaults)
+
+    return listener, defaults["stt_engine"], defaults["vad"], _MOCK_WAKE_MODEL
+
+
+class _FakeRawInputStream:
+    """sounddevice.RawInputStream stand-in that feeds loud int16 noise frames.
+
+    A thread hands the callback one block every few milliseconds. Each
+    frame's first sample is its index, so a test can find the frame that
+    any recorded block came from in `delivered`.
+    """
+
+    def __init__(self, samplerate, channels, dtype, blocksize, callback):
+        self._blocksize = blocksize
+        self._callback = callback
+        self._running = threading.Event()
+        self._rng = np.random.default_rng(0)
+        self.delivered: list[np.ndarray] = []
+
+    def start(self):
+        self._running.set()
+        threading.Thread(target=self._feed, daemon=True).start()
+
+    def stop(self):
+        self._running.clear()
+
+    def close(self):
+        self._running.clear()
+
+    def _feed(self):
+        while self._running.is_set():
+            frame = self._rng.integers(-32768, 32768, self._blocksize, dtype=np.int16)
+            frame[0] = len(self.delivered) % 32768
+            self.delivered.append(frame)
+            self._callback(frame.tobytes(), self._blocksize, None, None)
+            time.sleep(0.002)
+
+
+@pytest.fixture
+def fake_mic(tmp_path):
+    """Patch in a fake sounddevice; yields the list of streams opened."""
+    streams = []
+
+    def open_stream(**kwargs):
+        stream = _FakeRawInputStream(**kwargs)
+        streams.append(stream)
+        return stream
+
+    mock_sd = MagicMock()
+    mock_sd.RawInputStream.side_effect = open_stream
+    with patch.dict("sys.modules", {"sounddevice": mock_sd}), \
+            patch("wake_listener.WAKE_MIC_LOCK_PATH", str(tmp_path / "mic.lock")), \
+            patch("wake_listener._lower_thread_priority"):
+        yield streams
+
+
+def _wait_for(predicate, timeout=5.0):
+    """Poll until predicate() is true; False if it never was within timeout."""
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        if time.monotonic() >= deadline:
+            return False
+        time.sleep(0.01)
+    return True
+
+
 class TestWakeWordListenerInit:
     """Tests for WakeWordListener initialization."""
 
-    def _make_listener(self, **kwargs):
-        mock_stt = MagicMock()
-        mock_stt.transcribe.return_value = TranscriptionResult(
-            text="hello world", confidence=0.9, transcription_ms=200.0
-        )
-        mock_vad = MagicMock()
-        mock_vad.is_speech.return_value = False
-
-        defaults = {
-            "stt_engine": mock_stt,
-            "vad": mock_vad,
-            "wake_model_name": "hey_jarvis_v0.1",
-            "threshold": 0.5,
-            "tmux_session": "agent-voice-test",
-            "ready_sound": None,
-            "recording_timeout": 10,
-            "no_speech_timeout": 5,
-        }
-        defaults.update(kwargs)
-
-        mock_oww = MagicMock()
-        mock_model = MagicMock()
-        mock_oww.model.Model.return_value = mock_model
-
-        with patch.dict("sys.modules", {"openwakeword": mock_oww, "openwakeword.model": mock_oww.model}):
-            from wake_listener import WakeWordListener
-            listener = WakeWordListener(**defaults)
-
-        return listener, mock_stt, mock_vad, mock_model
-
     def test_initial_state_is_disabled(self):
-        listener, _, _, _ = self._make_listener()
+        listener, _, _, _ = _make_listener()
         assert listener.state == "disabled"
         assert listener.is_listening is False
 
     def test_sound_resolution_tink_macos(self):
         with patch("platform.system", return_value="Darwin"):
-            from wake_listener import WakeWordListener
             result = WakeWordListener._resolve_sound("tink")
             assert result == "/System/Library/Sounds/Tink.aiff"
 
     def test_sound_resolution_none(self):
-        from wake_listener import WakeWordListener
         assert WakeWordListener._resolve_sound(None) is None
         assert WakeWordListener._resolve_sound("") is None
 
+    def test_ready_sound_preloaded(self, tmp_path):
+        sf = pytest.importorskip("soundfile")
+        path = tmp_path / "ready.wav"
+        sf.write(str(path), np.zeros(800, dtype=np.float32), 16000)
+
+        listener, _, _, _ = _make_listener(ready_sound=str(path))
+
+        data, sample_rate = listener._ready_audio
+        assert data.dtype == np.float32 and len(data) == 800
+        assert sample_rate == 16000
+
+    @patch("subprocess.run")
+    def test_preloaded_ready_sound_plays_without_subprocess(self, mock_run):
+        listener, _, _, _ = _make_listener()
+        listener._ready_sound = "/tmp/ready.wav"
+        listener._ready_audio = (np.zeros(800, dtype=np.float32), 16000)
+        mock_sd = MagicMock()
+
+        with patch.dict("sys.modules", {"sounddevice": mock_sd}):
+            listener._play_ready_sound()
+
+        mock_sd.play.assert_called_once_with(listener._ready_audio[0], 16000, blocking=True)
+        mock_run.assert_not_called()
+
+
+class TestModelLookup:
+    """Tests for locating wake word and feature model files."""
+
+    def test_find_wake_model_prefers_int8(self, tmp_path):
+        (tmp_path / "hey_listen.onnx").write_bytes(b"")
+        (tmp_path / "hey_listen_int8.onnx").write_bytes(b"")
+        with patch("wake_listener._MODEL_DIRS", [str(tmp_path)]):
+            assert WakeWordListener._find_wake_model("hey_listen") == str(tmp_path / "hey_listen_int8.onnx")
+
+    def test_find_wake_model_falls_back_to_fp32(self, tmp_path):
+        (tmp_path / "hey_listen.onnx").write_bytes(b"")
+        with patch("wake_listener._MODEL_DIRS", [str(tmp_path)]):
+            assert WakeWordListener._find_wake_model("hey_listen") == str(tmp_path / "hey_listen.onnx")
+
+    def test_int8_feature_models_passed_to_openwakeword(self, tmp_path):
+        (tmp_path / "melspectrogram_int8.onnx").write_bytes(b"")
+        (tmp_path / "embedding_model_int8.onnx").write_bytes(b"")
+        with patch("wake_listener._MODEL_DIRS", [str(tmp_path)]):
+            _make_listener()
+
+        kwargs = _MOCK_OWW.model.Model.call_args.kwargs
+        assert kwargs["melspec_model_path"] == str(tmp_path / "melspectrogram_int8.onnx")
+        assert kwargs["embedding_model_path"] == str(tmp_path / "embedding_model_int8.onnx")
+
+    def test_bundled_feature_models_used_without_int8_files(self, tmp_path):
+        with patch("wake_listener._MODEL_DIRS", [str(tmp_path)]):
+            _make_listener()
+
+        kwargs = _MOCK_OWW.model.Model.call_args.kwargs
+        assert "melspec_model_path" not in kwargs
+        assert kwargs["wakeword_models"] == ["hey_jarvis_v0.1"]
+
 
 class TestMicYieldReclaim:
     """Tests for mic ownership handoff."""
 
     def _make_listener(self):
-        mock_stt = MagicMock()
-        mock_vad = MagicMock()
-
-        mock_oww = MagicMock()
-        mock_model = MagicMock()
-        mock_oww.model.Model.return_value = mock_model
-
-        with patch.dict("sys.modules", {"openwakeword": mock_oww, "openwakeword.model": mock_oww.model}):
-            from wake_listener import WakeWordListener, WakeState
-            listener = WakeWordListener(
-                stt_engine=mock_stt, vad=mock_vad,
-                wake_model_name="test", tmux_session="test",
-                ready_sound=None,
-            )
-            # Simulate listening state
-            listener._state = WakeState.LISTENING
-
+        listener, _, _, _ = _make_listener(wake_model_name="test", tmux_session="test")
+        # Simulate listening state
+        listener._state = WakeState.LISTENING
         return listener
 
     def test_yield_sets_event(self):
         listener = self._make_listener()
         # yield_mic checks state, but since we're not running the thread,
         # just verify the event gets set
-        from wake_listener import WakeState
         listener._yield_event.set()
         assert listener._yield_event.is_set()
 
@@ -105,26 +234,52 @@ class TestMicYieldReclaim:
         listener.reclaim_mic()
         assert not listener._yield_event.is_set()
         assert not listener._yield_done.is_set()
+        assert listener._resume_event.is_set()
+
+    def test_yield_discards_earlier_reclaim(self):
+        listener = self._make_listener()
+        listener.reclaim_mic()  # e.g. after a listen call that never needed the mic
+        listener._yield_done.set()  # no loop thread: pretend it paused
+        listener.yield_mic()
+        assert listener._yield_event.is_set()
+        assert not listener._resume_event.is_set()
+
+    def test_stop_wakes_yielded_loop(self):
+        listener = self._make_listener()
+        listener.stop()
+        assert listener._resume_event.is_set()
+        assert listener._ring._ready.is_set()  # and one blocked on the mic
+
+    def test_restart_after_stop_while_yielded_listens(self, fake_mic):
+        listener, _, _, model = _make_listener(wake_model_name="test", tmux_session="test")
+        model.predict.return_value = {"test": 0.0}
+        listener.start()
+        assert _wait_for(lambda: listener.state == "listening" and fake_mic)
+        listener.yield_mic()
+        assert listener.state == "yielded"
+        listener.stop()
+
+        listener.start()
+        try:
+            # A stale yield would leave the loop toggling states with no stream open
+            assert _wait_for(lambda: len(fake_mic) == 2)
+            time.sleep(0.1)
+            assert listener.state == "listening"
+            assert len(fake_mic) == 2
+        finally:
+            listener.stop()
 
 
 class TestTextInjection:
     """Tests for tmux text injection routing."""
 
-    def _make_listener(self):
-        mock_stt = MagicMock()
-        mock_vad = MagicMock()
-
-        mock_oww = MagicMock()
-        mock_model = MagicMock()
-        mock_oww.model.Model.return_value = mock_model
-
-        with patch.dict("sys.modules", {"openwakeword": mock_oww, "openwakeword.model": mock_oww.model}):
-            from wake_listener import WakeWordListener
-            listener = WakeWordListener(
-                stt_engine=mock_stt, vad=mock_vad,
-                wake_model_name="test", tmux_session="agent-voice-123",
-                ready_sound=None,
-            )
+    def _make_listener(self, control=None):
+        """Listener whose control-mode fast path is the given fake, or disabled."""
+        listener, _, _, _ = _make_listener(wake_model_name="test", tmux_session="agent-voice-123")
+        if control is None:
+            listener._tmux_control_disabled = True
+        else:
+            listener._tmux_control = control
         return listener
 
     @patch("subprocess.run")
@@ -136,13 +291,25 @@ class TestTextInjection:
         listener = self._make_listener()
         listener._inject_text("hello world")
 
-        # Should send literal text then Enter
-        assert mock_run.call_count == 2
-        literal_call = mock_run.call_args_list[0]
-        assert "-l" in literal_call[0][0]
-        assert "hello world" in literal_call[0][0]
-        enter_call = mock_run.call_args_list[1]
-        assert "Enter" in enter_call[0][0]
+        # Should send literal text then Enter in a single tmux invocation
+        mock_run.assert_called_once()
+        assert mock_run.call_args[0][0] == [
+            "tmux", "send-keys", "-t", "agent-voice-123", "-l", "hello world",
+            ";", "send-keys", "-t", "agent-voice-123", "Enter",
+        ]
+
+    @patch("subprocess.run")
+    @patch("session_registry.get_active_sessions")
+    def test_trailing_semicolon_escaped(self, mock_sessions, mock_run):
+        """A trailing ';' would otherwise end the tmux command early."""
+        mock_sessions.return_value = [
+            {"name": "Eric", "tmux_session": "agent-voice-123", "pid": 1}
+        ]
+        listener = self._make_listener()
+        listener._inject_text("list the files;")
+
+        cmd = mock_run.call_args[0][0]
+        assert cmd[cmd.index("-l") + 1] == "list the files\\;"
 
     @patch("subprocess.run")
     @patch("session_registry.get_active_sessions")
@@ -215,24 +382,226 @@ class TestTextInjection:
         assert "$(rm -rf /)" in cmd  # Text sent as-is, not interpreted
 
 
+    @patch("subprocess.run")
+    @patch("session_registry.get_active_sessions")
+    def test_control_mode_sends_quoted_command(self, mock_sessions, mock_run):
+        mock_sessions.return_value = [
+            {"name": "Eric", "tmux_session": "agent-voice-123", "pid": 1}
+        ]
+        control = MagicMock()
+        control.alive.return_value = True
+        control.send.return_value = True
+        listener = self._make_listener(control=control)
+        listener._inject_text("it's $HOME; ok")
+
+        control.send.assert_called_once_with(
+            "send-keys -t 'agent-voice-123' -l 'it'\\''s $HOME; ok' ; "
+            "send-keys -t 'agent-voice-123' Enter"
+        )
+        mock_run.assert_not_called()
+
+    @patch("subprocess.run")
+    @patch("session_registry.get_active_sessions")
+    def test_control_mode_failure_falls_back_to_send_keys(self, mock_sessions, mock_run):
+        mock_sessions.return_value = [
+            {"name": "Eric", "tmux_session": "agent-voice-123", "pid": 1}
+        ]
+        control = MagicMock()
+        control.alive.return_value = True
+        control.send.return_value = False  # pipe died mid-write
+        listener = self._make_listener(control=control)
+        listener._inject_text("hello")
+
+        mock_run.assert_called_once()
+        assert "-l" in mock_run.call_args[0][0]
+
+
+class TestFrameRing:
+    """Tests for the wake loop's preallocated audio frame ring."""
+
+    def test_frames_returned_in_order(self):
+        ring = _FrameRing(4)
+        ring.push(np.array([1, 2, 3, 4], dtype=np.int16))
+        ring.push(np.array([5, 6, 7, 8], dtype=np.int16))
+
+        assert ring.pop(timeout=0).tolist() == [1, 2, 3, 4]
+        assert ring.pop(timeout=0).tolist() == [5, 6, 7, 8]
+        assert ring.pop(timeout=0) is None
+
+    def test_short_block_returns_only_its_samples(self):
+        ring = _FrameRing(4)
+        ring.push(np.array([9, 9], dtype=np.int16))
+        assert ring.pop(timeout=0).tolist() == [9, 9]
+
+    def test_full_ring_drops_new_frames_without_touching_popped_view(self):
+        ring = _FrameRing(2, slots=3)
+        ring.push(np.array([1, 1], dtype=np.int16))
+        view = ring.pop(timeout=0)
+        for value in (2, 3, 4):  # only two fit while `view` is held
+            ring.push(np.full(2, value, dtype=np.int16))
+
+        assert view.tolist() == [1, 1]
+        assert ring.pop(timeout=0).tolist() == [2, 2]
+        assert ring.pop(timeout=0).tolist() == [3, 3]
+        assert ring.pop(timeout=0) is None
+
+    def test_pop_wakes_on_push_from_another_thread(self):
+        ring = _FrameRing(2)
+        timer = threading.Timer(0.05, ring.push, [np.array([7, 7], dtype=np.int16)])
+        timer.start()
+        try:
+            assert ring.pop(timeout=2).tolist() == [7, 7]
+        finally:
+            timer.join()
+
+    def test_wake_interrupts_waiting_pop(self):
+        ring = _FrameRing(2)
+        timer = threading.Timer(0.05, ring.wake)
+        timer.start()
+        start = time.monotonic()
+        try:
+            assert ring.pop(timeout=5) is None
+        finally:
+            timer.join()
+        assert time.monotonic() - start < 2
+
+    def test_clear_discards_queued_frames(self):
+        ring = _FrameRing(2)
+        ring.push(np.array([1, 1], dtype=np.int16))
+        ring.clear()
+        assert ring.pop(timeout=0) is None
+
+
+class TestSilenceGate:
+    """Tests for skipping wake inference during sustained silence."""
+
+    _QUIET = np.full(1280, 5, dtype=np.int16)
+    _LOUD = np.tile(np.array([3000, -3000], dtype=np.int16), 640)
+
+    def test_silence_fed_until_context_is_silent(self):
+        gate = _SilenceGate(context_frames=3)
+        assert [gate.skip(self._QUIET) for _ in range(5)] == [False, False, False, True, True]
+
+    def test_loud_frame_resumes_inference(self):
+        gate = _SilenceGate(context_frames=1)
+        gate.skip(self._QUIET)
+        assert gate.skip(self._QUIET) is True
+        assert gate.skip(self._LOUD) is False
+        assert gate.skip(self._QUIET) is False  # context holds speech again
+
+    def test_full_scale_negative_samples_are_loud(self):
+        gate = _SilenceGate(context_frames=0)
+        assert gate.skip(np.full(1280, -32768, dtype=np.int16)) is False
+
+    def test_reset_restarts_count(self):
+        gate = _SilenceGate(context_frames=1)
+        gate.skip(self._QUIET)
+        gate.reset()
+        assert gate.skip(self._QUIET) is False
+
+
+class TestListenerPriority:
+    """Tests for deprioritizing the listener thread."""
+
+    @patch("os.setpriority")
+    @patch("platform.system", return_value="Linux")
+    def test_linux_renices_only_calling_thread(self, _, mock_setpriority):
+        _lower_thread_priority()
+        mock_setpriority.assert_called_once_with(
+            os.PRIO_PROCESS, threading.get_native_id(), 10
+        )
+
+    @patch("os.setpriority")
+    @patch("platform.system", return_value="Darwin")
+    def test_macos_leaves_process_priority_alone(self, _, mock_setpriority):
+        _lower_thread_priority()
+        mock_setpriority.assert_not_called()
+
+
 class TestRecordingTimeout:
     """Tests for recording timeout behavior."""
 
     def test_no_speech_timeout_config(self):
-        mock_stt = MagicMock()
-        mock_vad = MagicMock()
-
-        mock_oww = MagicMock()
-        mock_oww.model.Model.return_value = MagicMock()
-
-        with patch.dict("sys.modules", {"openwakeword": mock_oww, "openwakeword.model": mock_oww.model}):
-            from wake_listener import WakeWordListener
-            listener = WakeWordListener(
-                stt_engine=mock_stt, vad=mock_vad,
-                wake_model_name="test", tmux_session="test",
-                ready_sound=None,
-                recording_timeout=10,
-                no_speech_timeout=5,
-            )
+        listener, _, _, _ = _make_listener(
+            wake_model_name="test", tmux_session="test",
+            recording_timeout=10, no_speech_timeout=5,
+        )
         assert listener._recording_timeout == 10
         assert listener._no_speech_timeout == 5
+
+
+class _ScriptedVAD:
+    """VAD stand-in that hears speech in the first `speech_chunks` chunks only."""
+
+    def __init__(self, speech_chunks):
+        self._speech_chunks = speech_chunks
+        self.chunks: list[int] = []  # length of each chunk scored
+
+    def reset(self):
+        self.chunks.clear()
+
+    def is_speech(self, chunk):
+        self.chunks.append(len(chunk))
+        return len(self.chunks) <= self._speech_chunks
+
+
+class TestWakeRecording:
+    """Tests for the listen loop's wake detection and post-wake recording."""
+
+    def _start(self, vad, **kwargs):
+        stt = MagicMock()
+        stt.transcribe.return_value = _StubSTT._RESULT
+        listener, _, _, model = _make_listener(stt_engine=stt, vad=vad, **kwargs)
+        # Wake on the third frame inferred, never again
+        scores = iter([0.0, 0.0, 0.9])
+        model.predict.side_effect = lambda chunk: {"test": next(scores, 0.0)}
+        listener._inject_text = MagicMock()
+        listener._ring.clear = MagicMock(wraps=listener._ring.clear)
+        listener.start()
+        return listener, stt, model
+
+    def test_records_from_wake_stream_until_silence(self, fake_mic):
+        vad = _ScriptedVAD(speech_chunks=4)
+        listener, stt, model = self._start(vad)
+        try:
+            assert _wait_for(lambda: listener._inject_text.called)
+            assert _wait_for(lambda: listener.state == "listening")
+
+            # 4 speech chunks, then 1.5 s of silence (47 chunks of 512 samples)
+            assert vad.chunks == [512] * 51
+            (audio, sample_rate), _ = stt.transcribe.call_args
+            assert sample_rate == STT_SAMPLE_RATE
+            assert len(audio) == 21 * 1280  # whole frames, up to the one completing chunk 51
+            assert audio.dtype == np.float32
+
+            # Every recorded frame is its int16 source scaled by 1/32768
+            delivered = fake_mic[0].delivered
+            for block in audio.reshape(-1, 1280):
+                source = delivered[int(round(block[0] * 32768))]
+                assert np.array_equal(block, source.astype(np.float32) / 32768)
+
+            # Wake detection and recording shared the one stream
+            assert len(fake_mic) == 1
+            assert fake_mic[0]._running.is_set()
+            listener._inject_text.assert_called_once_with("hello world")
+
+            # Fresh detection state: model reset, and the ring cleared at stream
+            # open, before recording, and after the wake was handled
+            model.reset.assert_called_once()
+            assert listener._ring.clear.call_count == 3
+        finally:
+            listener.stop()
+
+    def test_stop_ends_recording_in_progress(self, fake_mic):
+        vad = _ScriptedVAD(speech_chunks=10**9)  # speech never ends
+        listener, stt, _ = self._start(vad, recording_timeout=30)
+        assert _wait_for(lambda: vad.chunks)
+        assert listener.state == "recording"
+
+        started = time.monotonic()
+        listener.stop()
+        assert time.monotonic() - started < 1
+        assert listener._thread is None
+        stt.transcribe.assert_not_called()
+        listener._inject_text.assert_not_called()
+        assert not fake_mic[0]._running.is_set()
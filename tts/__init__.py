@@ -1,7 +1,20 @@
 """TTS subsystem for VoiceSmith MCP Server."""
 
-from tts.kokoro_engine import KokoroEngine
-from tts.audio_player import AudioPlayer
-from tts.speech_queue import SpeechQueue
-
 __all__ = ["KokoroEngine", "AudioPlayer", "SpeechQueue"]
+
+_SUBMODULES = {
+    "KokoroEngine": "tts.kokoro_engine",
+    "AudioPlayer": "tts.audio_player",
+    "SpeechQueue": "tts.speech_queue",
+}
+
+
+def __getattr__(name: str):
+    # Resolved on first access (PEP 562) so importing tts.media_duck alone
+    # doesn't pull in numpy
+    if name in _SUBMODULES:
+        import importlib
+        value = getattr(importlib.import_module(_SUBMODULES[name]), name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
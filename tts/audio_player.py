@@ -1,18 +1,50 @@
 """Audio playback via external player (mpv, afplay, aplay)."""
 
 import fcntl
+import functools
 import os
 import platform
+import shutil
 import subprocess
 import tempfile
 import time
+import wave
 
-import soundfile as sf
+import numpy as np
 
-from shared import PlaybackResult, AudioPlayerError, AUDIO_LOCK_PATH, get_logger
+from shared import PlaybackResult, AudioPlayerError, AUDIO_LOCK_PATH, SAMPLE_RATE, get_logger
 
 logger = get_logger("tts.audio_player")
 
+# Players fed headerless float32 PCM on stdin; the rest get a temp WAV file
+_STDIN_PLAYERS = ("mpv", "aplay")
+
+# Fixed leading argv of each known player; anything else is run as a bare command
+_PLAYER_ARGV_PREFIX = {
+    "mpv": ("mpv", "--no-terminal", "--no-video"),
+    "afplay": ("afplay",),
+    "aplay": ("aplay",),
+}
+
+# Temp WAVs go to RAM-backed /dev/shm where it exists (Linux); macOS uses the default tmpdir
+_TEMP_WAV_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def _to_pcm16(samples) -> np.ndarray:
+    """Convert samples to contiguous int16 PCM, clipping float input to [-1, 1].
+
+    A plain int16 cast does not clip, so out-of-range floats would wrap
+    around instead of saturating. int16 input is passed through unchanged.
+    """
+    samples = np.asarray(samples)
+    if samples.dtype == np.int16:
+        return np.ascontiguousarray(samples)
+    clipped = np.clip(np.asarray(samples, dtype=np.float32), -1.0, 1.0)
+    # Scale straight into the int16 output: one pass instead of scale then astype
+    pcm = np.empty(clipped.shape, dtype=np.int16)
+    np.multiply(clipped, 32767.0, out=pcm, casting="unsafe")
+    return pcm
+
 
 class AudioPlayer:
     """Plays audio samples through an external player process."""
@@ -21,6 +53,17 @@ class AudioPlayer:
         self._player_command = player_command
         self._audio_output_device = audio_output_device
         self._process: subprocess.Popen | None = None
+        # monotonic() time the current clip should finish; is_playing skips polling before it
+        self._expected_end = 0.0
+        # Open stream (see open_stream): its player process, held lock file, rate and frames written
+        self._stream_process: subprocess.Popen | None = None
+        self._stream_lock_file = None
+        self._stream_rate = 0
+        self._stream_frames = 0
+        # Reused for every clip sent to a player that can't read stdin (afplay); removed by close()
+        self._tmp_wav_path = os.path.join(
+            _TEMP_WAV_DIR or tempfile.gettempdir(), f"voicesmith-{os.getpid()}-{id(self):x}.wav"
+        )
 
         # Detect platform fallback if player_command is not available
         if not self._command_exists(player_command):
@@ -34,18 +77,14 @@ class AudioPlayer:
             else:
                 logger.warning(f"'{player_command}' not found and no fallback for {system}")
 
+        # The player is fixed from here on; _build_command only adds per-call arguments
+        self._cmd_prefix = _PLAYER_ARGV_PREFIX.get(self._player_command, (self._player_command,))
+
     @staticmethod
+    @functools.lru_cache(maxsize=None)
     def _command_exists(cmd: str) -> bool:
-        """Check if a command is available on the system."""
-        try:
-            subprocess.run(
-                ["which", cmd],
-                capture_output=True,
-                check=True,
-            )
-            return True
-        except (subprocess.CalledProcessError, FileNotFoundError):
-            return False
+        """Check if a command is on PATH (looked up in-process, once per name)."""
+        return shutil.which(cmd) is not None
 
     _available_devices_cache: list[str] | None = None
     _available_devices_ts: float = 0.0
@@ -78,15 +117,25 @@ class AudioPlayer:
             logger.warning(f"Failed to query audio devices: {e}")
             return []
 
-    def _build_command(self, path: str) -> list[str]:
-        """Build the player command list for the given audio file path.
+    def _build_command(self, path: str | None, sample_rate: int = SAMPLE_RATE) -> list[str]:
+        """Build the player command list for the given audio file path ("-" for stdin).
+
+        For mpv and aplay, path=None reads raw mono float32 PCM at sample_rate
+        from stdin.
 
         Re-reads audio_output_device from config on each call so device
         changes take effect immediately without restarting the server.
         Falls back to system default if the configured device is unavailable.
         """
+        cmd = list(self._cmd_prefix)
         if self._player_command == "mpv":
-            cmd = ["mpv", "--no-terminal", "--no-video"]
+            if path is None:
+                cmd.extend([
+                    "--demuxer=rawaudio",
+                    f"--demuxer-rawaudio-rate={sample_rate}",
+                    "--demuxer-rawaudio-format=floatle",
+                    "--demuxer-rawaudio-channels=1",
+                ])
             # Check live config for device (picks up menu bar changes)
             device = self._get_live_output_device()
             if device:
@@ -97,15 +146,11 @@ class AudioPlayer:
                     )
                     device = None
             if device:
-                cmd.extend([f"--audio-device={device}"])
-            cmd.append(path)
-            return cmd
-        elif self._player_command == "afplay":
-            return ["afplay", path]
-        elif self._player_command == "aplay":
-            return ["aplay", path]
-        else:
-            return [self._player_command, path]
+                cmd.append(f"--audio-device={device}")
+        elif path is None:  # aplay
+            cmd.extend(["-q", "-t", "raw", "-f", "FLOAT_LE", "-r", str(sample_rate), "-c", "1"])
+        cmd.append("-" if path is None else path)
+        return cmd
 
     _config_path_override: str | None = None  # For testing: set to skip live config reads
 
@@ -142,19 +187,20 @@ class AudioPlayer:
             sample_rate: Sample rate in Hz.
 
         Returns:
-            PlaybackResult with success status and timing.
+            PlaybackResult with success status and the clip's audio duration.
 
         Raises:
             AudioPlayerError: If playback fails.
         """
-        tmp_path = None
+        stdin_data = None
         try:
-            # Write samples to a temporary WAV file
-            fd, tmp_path = tempfile.mkstemp(suffix=".wav")
-            os.close(fd)
-            sf.write(tmp_path, samples, sample_rate)
-
-            cmd = self._build_command(tmp_path)
+            if self._player_command in _STDIN_PLAYERS:
+                # Pipe the float32 samples as-is: no disk write, WAV framing or int16 conversion
+                stdin_data = np.ascontiguousarray(samples, dtype=np.float32).data
+                cmd = self._build_command(None, sample_rate)
+            else:
+                # afplay can't read stdin; it plays this player's reusable temp WAV
+                cmd = self._build_command(self._tmp_wav_path)
             logger.debug(f"Playing audio: {' '.join(cmd)}")
 
             # Cross-session audio lock: prevents overlapping playback
@@ -162,17 +208,31 @@ class AudioPlayer:
             with open(AUDIO_LOCK_PATH, "w") as lock_file:
                 fcntl.flock(lock_file, fcntl.LOCK_EX)
 
-                start = time.perf_counter()
+                if stdin_data is None:
+                    # Written under the lock so a concurrent play() can't overwrite it mid-clip
+                    with open(self._tmp_wav_path, "wb") as f, wave.open(f, "wb") as wav:
+                        wav.setnchannels(1)
+                        wav.setsampwidth(2)
+                        wav.setframerate(sample_rate)
+                        wav.writeframes(_to_pcm16(samples))
+
                 self._process = subprocess.Popen(
                     cmd,
+                    stdin=subprocess.PIPE if stdin_data is not None else subprocess.DEVNULL,
                     stdout=subprocess.DEVNULL,
                     stderr=subprocess.DEVNULL,
                 )
-                self._process.wait()
-                duration_ms = (time.perf_counter() - start) * 1000
+                self._expected_end = time.monotonic() + len(samples) / sample_rate
+                if stdin_data is not None:
+                    self._process.communicate(stdin_data)
+                else:
+                    self._process.wait()
 
             # Lock released when lock_file closes
 
+            # Length of the audio itself; player startup isn't part of it
+            duration_ms = len(samples) / sample_rate * 1000
+
             if self._process.returncode != 0:
                 return PlaybackResult(
                     success=False,
@@ -186,11 +246,119 @@ class AudioPlayer:
             raise AudioPlayerError(f"Playback failed: {e}") from e
         finally:
             self._process = None
-            if tmp_path and os.path.exists(tmp_path):
-                try:
-                    os.unlink(tmp_path)
-                except OSError:
-                    pass
+            self._expected_end = 0.0
+
+    def close(self) -> None:
+        """Stop playback and remove the reusable temp WAV, if one was written."""
+        self.stop()
+        try:
+            os.unlink(self._tmp_wav_path)
+        except FileNotFoundError:
+            pass
+        except OSError as e:
+            logger.debug(f"Failed to remove {self._tmp_wav_path}: {e}")
+
+    def open_stream(self, sample_rate: int) -> bool:
+        """Start one player process that plays raw PCM as it is written.
+
+        Lets a multi-chunk utterance play through a single player instead of
+        one process (and audio device open) per chunk. Holds the cross-session
+        audio lock until close_stream().
+
+        Args:
+            sample_rate: Sample rate in Hz of everything written to the stream.
+
+        Returns:
+            True if the stream is open; False if the player can't read stdin
+            (afplay), in which case the caller should use play() per chunk.
+
+        Raises:
+            AudioPlayerError: If the player cannot be started.
+        """
+        if self._player_command not in _STDIN_PLAYERS:
+            return False
+        cmd = self._build_command(None, sample_rate)
+        logger.debug(f"Opening audio stream: {' '.join(cmd)}")
+
+        lock_file = open(AUDIO_LOCK_PATH, "w")
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            # Unbuffered stdin: write() hands the sample buffer straight to the pipe
+            process = subprocess.Popen(
+                cmd,
+                bufsize=0,
+                stdin=subprocess.PIPE,
+                stdout=subprocess.DEVNULL,
+                stderr=subprocess.DEVNULL,
+            )
+        except Exception as e:
+            lock_file.close()
+            raise AudioPlayerError(f"Playback failed: {e}") from e
+
+        self._stream_lock_file = lock_file
+        self._stream_process = process
+        self._stream_rate = sample_rate
+        self._stream_frames = 0
+        self._process = process
+        self._expected_end = time.monotonic()
+        return True
+
+    def write(self, samples) -> bool:
+        """Queue samples on the open stream.
+
+        Blocks only until the player's pipe accepts the data, not until it
+        has been heard.
+
+        Returns:
+            False if there is no open stream or the player has exited or been
+            stopped; close_stream() reports why.
+        """
+        process = self._process
+        if process is None or process is not self._stream_process:
+            return False
+        data = np.ascontiguousarray(samples, dtype=np.float32)
+        view = memoryview(data).cast("B")
+        try:
+            # Raw pipe writes may be partial; resume from a view rather than a copy
+            while view:
+                view = view[process.stdin.write(view):]
+        except (OSError, ValueError):
+            return False
+        self._stream_frames += len(data)
+        self._expected_end = max(self._expected_end, time.monotonic()) + len(data) / self._stream_rate
+        return True
+
+    def close_stream(self) -> PlaybackResult:
+        """Finish the open stream: wait for buffered audio to play, then release the lock.
+
+        Returns:
+            PlaybackResult with the total duration of the audio written.
+        """
+        process = self._stream_process
+        if process is None:
+            return PlaybackResult(success=False, duration_ms=0.0, error="No open audio stream")
+        try:
+            try:
+                process.stdin.close()
+            except OSError:
+                pass  # player already gone; its exit code says why
+            process.wait()
+            duration_ms = self._stream_frames / self._stream_rate * 1000
+            if process.returncode != 0:
+                return PlaybackResult(
+                    success=False,
+                    duration_ms=duration_ms,
+                    error=f"Player exited with code {process.returncode}",
+                )
+            return PlaybackResult(success=True, duration_ms=duration_ms)
+        finally:
+            # Clear state before unlocking so a waiting stream can't see it
+            if self._process is process:
+                self._process = None
+                self._expected_end = 0.0
+            self._stream_process = None
+            self._stream_lock_file.close()
+            self._stream_lock_file = None
 
     def stop(self) -> bool:
         """Stop any currently playing audio.
@@ -208,9 +376,20 @@ class AudioPlayer:
                 return False
             finally:
                 self._process = None
+                self._expected_end = 0.0
         return False
 
     @property
     def is_playing(self) -> bool:
-        """Return True if audio is currently playing."""
-        return self._process is not None and self._process.poll() is None
+        """Return True if audio is currently playing.
+
+        Until the clip's expected end this trusts the running process without
+        a poll() (a waitpid syscall), so a player that dies early is only
+        noticed once that time has passed.
+        """
+        process = self._process
+        if process is None:
+            return False
+        if time.monotonic() < self._expected_end:
+            return True
+        return process.poll() is None
@@ -1,6 +1,8 @@
 """Kokoro ONNX TTS engine wrapper."""
 
+import threading
 import time
+from collections import OrderedDict
 
 import numpy as np
 
@@ -8,12 +10,20 @@ from shared import SynthesisResult, TTSEngineError, ALL_VOICE_IDS, SAMPLE_RATE,
 
 logger = get_logger("tts.kokoro")
 
+# Recently synthesized model output, replayed for repeated utterances ("OK",
+# greetings). Bounded by total sample count: ~32 MB of float32.
+_SYNTH_CACHE_MAX_SAMPLES = 8 * 1024 * 1024
+
 
 class KokoroEngine:
     """Wrapper around kokoro-onnx for text-to-speech synthesis."""
 
     def __init__(self, model_path: str, voices_path: str) -> None:
         self._loaded = False
+        # (text, voice_id, speed) -> (read-only samples, sample_rate), oldest first
+        self._synth_cache: OrderedDict[tuple[str, str, float], tuple[np.ndarray, int]] = OrderedDict()
+        self._synth_cache_samples = 0
+        self._synth_cache_lock = threading.Lock()
         try:
             import kokoro_onnx
             self._model = kokoro_onnx.Kokoro(model_path, voices_path)
@@ -33,6 +43,23 @@ class KokoroEngine:
         Returns:
             SynthesisResult with samples, sample_rate, duration_ms, synthesis_ms.
 
+        Raises:
+            TTSEngineError: If voice_id is invalid or synthesis fails.
+        """
+        return self.synthesize_into(text, voice_id, speed, None)
+
+    def synthesize_into(
+        self, text: str, voice_id: str, speed: float, out: np.ndarray | None
+    ) -> SynthesisResult:
+        """Synthesize text, writing the padded samples into a caller-owned buffer.
+
+        The result's samples are a view of out[:n] when the padded audio
+        fits, so repeated calls reuse one allocation. Otherwise (or when out
+        is None) a new array is allocated, as synthesize() does.
+
+        Repeats of a recent (text, voice_id, speed) reuse the cached model
+        output and report synthesis_ms of 0.
+
         Raises:
             TTSEngineError: If voice_id is invalid or synthesis fails.
         """
@@ -45,9 +72,16 @@ class KokoroEngine:
             raise TTSEngineError("Kokoro engine is not loaded")
 
         try:
-            start = time.perf_counter()
-            samples, sample_rate = self._model.create(text, voice=voice_id, speed=speed)
-            synthesis_ms = (time.perf_counter() - start) * 1000
+            key = (text, voice_id, speed)
+            cached = self._cache_get(key)
+            if cached is not None:
+                samples, sample_rate = cached
+                synthesis_ms = 0.0
+            else:
+                start = time.perf_counter()
+                samples, sample_rate = self._model.create(text, voice=voice_id, speed=speed)
+                synthesis_ms = (time.perf_counter() - start) * 1000
+                self._cache_put(key, samples, sample_rate)
 
             # Pad silence at head and tail to prevent clipping.
             # Head: audio devices need a moment to initialise after player starts.
@@ -55,16 +89,18 @@ class KokoroEngine:
             #       which can clip the trailing edge of the last phoneme.
             head_pad = int(sample_rate * 0.15)  # 150ms leading silence
             tail_pad = int(sample_rate * 0.10)   # 100ms trailing silence
-            samples = np.concatenate([
-                np.zeros(head_pad, dtype=samples.dtype),
-                samples,
-                np.zeros(tail_pad, dtype=samples.dtype),
-            ])
+            n = head_pad + len(samples) + tail_pad
+            if out is None or n > len(out):
+                out = np.empty(n, dtype=samples.dtype)
+            padded = out[:n]
+            padded[:head_pad] = 0
+            padded[head_pad:n - tail_pad] = samples
+            padded[n - tail_pad:] = 0
 
-            duration_ms = (len(samples) / sample_rate) * 1000
+            duration_ms = (n / sample_rate) * 1000
 
             return SynthesisResult(
-                samples=samples,
+                samples=padded,
                 sample_rate=sample_rate,
                 duration_ms=duration_ms,
                 synthesis_ms=synthesis_ms,
@@ -72,6 +108,30 @@ class KokoroEngine:
         except Exception as e:
             raise TTSEngineError(f"Synthesis failed: {e}") from e
 
+    def _cache_get(self, key: tuple[str, str, float]) -> tuple[np.ndarray, int] | None:
+        """Return cached (samples, sample_rate) for key, marking it recently used."""
+        with self._synth_cache_lock:
+            entry = self._synth_cache.get(key)
+            if entry is not None:
+                self._synth_cache.move_to_end(key)
+            return entry
+
+    def _cache_put(self, key: tuple[str, str, float], samples: np.ndarray, sample_rate: int) -> None:
+        """Cache model output, evicting least recently used entries to stay in budget."""
+        samples = np.asarray(samples)
+        if len(samples) > _SYNTH_CACHE_MAX_SAMPLES:
+            return
+        samples.setflags(write=False)  # shared by every later hit
+        with self._synth_cache_lock:
+            old = self._synth_cache.pop(key, None)
+            if old is not None:
+                self._synth_cache_samples -= len(old[0])
+            self._synth_cache[key] = (samples, sample_rate)
+            self._synth_cache_samples += len(samples)
+            while self._synth_cache_samples > _SYNTH_CACHE_MAX_SAMPLES:
+                _, (evicted, _) = self._synth_cache.popitem(last=False)
+                self._synth_cache_samples -= len(evicted)
+
     def is_loaded(self) -> bool:
         """Return whether the engine is loaded and ready."""
         return self._loaded
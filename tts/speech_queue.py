@@ -1,15 +1,119 @@
 """Speech queue for serialized TTS playback."""
 
 import asyncio
+import functools
 import time
+from concurrent.futures import ThreadPoolExecutor
 
-from shared import SpeakResult, MAX_CHUNK_LENGTH, get_logger
+import numpy as np
+
+from shared import SpeakResult, MAX_CHUNK_LENGTH, SAMPLE_RATE, get_logger
 from tts.kokoro_engine import KokoroEngine
 from tts.audio_player import AudioPlayer
 from tts.media_duck import duck, unduck
 
 logger = get_logger("tts.speech_queue")
 
+# Length of each reusable synthesis buffer; longer chunks fall back to a fresh array
+_SCRATCH_SECONDS = 30
+
+_sentence_kernel = None
+
+
+def _build_sentence_kernel():
+    """Return a sentence-end scanner over code points: Numba if installed, else NumPy.
+
+    Both return the exclusive end index of every '.', '!' or '?' that is
+    followed by a space or the end of the text.
+    """
+    try:
+        from numba import njit
+    except ImportError:
+        def _ends(codes):
+            is_punct = (codes == 46) | (codes == 33) | (codes == 63)
+            is_punct[:-1] &= codes[1:] == 32
+            return np.flatnonzero(is_punct) + 1
+        return _ends
+
+    @njit(cache=True, boundscheck=False)
+    def _ends(codes):
+        n = codes.shape[0]
+        out = np.empty(n, dtype=np.int64)
+        k = 0
+        for i in range(n):
+            c = codes[i]
+            if (c == 46 or c == 33 or c == 63) and (i + 1 == n or codes[i + 1] == 32):
+                out[k] = i + 1
+                k += 1
+        return out[:k]
+
+    return _ends
+
+
+def _sentence_ends(text: str) -> np.ndarray:
+    """Return the end index (exclusive) of each sentence in text."""
+    global _sentence_kernel
+    if _sentence_kernel is None:
+        # Built on first use so importing this module never pays for Numba
+        _sentence_kernel = _build_sentence_kernel()
+    # UTF-32 gives one array element per character, so indices slice the str directly;
+    # surrogatepass keeps lone surrogates (valid in a str) from failing the encode
+    codes = np.frombuffer(text.encode("utf-32-le", errors="surrogatepass"), dtype=np.uint32)
+    return _sentence_kernel(codes)
+
+
+@functools.lru_cache(maxsize=256)
+def _split_sentences(text: str, max_length: int) -> tuple[str, ...]:
+    """Split text into sentences and group them into chunks under max_length.
+
+    Cached because agents repeat many utterances verbatim. Returns a tuple
+    so callers can't mutate a cached result; chunk_text hands out lists.
+    """
+    # Split into sentences at each boundary, dropping the separating space.
+    # The kernel gives the exact boundary count, so both lists are sized
+    # up front (plus one slot for trailing text) instead of grown by append.
+    ends = _sentence_ends(text).tolist()
+    sentences: list = [None] * (len(ends) + 1)
+    n_sentences = 0
+    start = 0
+    for end in ends:
+        sentences[n_sentences] = text[start:end].strip()
+        n_sentences += 1
+        start = end
+
+    # Add any remaining text
+    remainder = text[start:].strip()
+    if remainder:
+        sentences[n_sentences] = remainder
+        n_sentences += 1
+
+    # Group sentences into chunks under max_length. Each chunk's sentences are
+    # collected and joined once, rather than re-copying a growing string.
+    chunks: list = [None] * n_sentences
+    n_chunks = 0
+    buf: list[str] = []
+    buf_len = 0  # len(" ".join(buf))
+
+    for i in range(n_sentences):
+        sentence = sentences[i]
+        if not buf_len:
+            buf = [sentence]
+            buf_len = len(sentence)
+        elif buf_len + 1 + len(sentence) <= max_length:
+            buf.append(sentence)
+            buf_len += 1 + len(sentence)
+        else:
+            chunks[n_chunks] = " ".join(buf)
+            n_chunks += 1
+            buf = [sentence]
+            buf_len = len(sentence)
+
+    if buf_len:
+        chunks[n_chunks] = " ".join(buf)
+        n_chunks += 1
+
+    return tuple(chunks[:n_chunks])
+
 
 class SpeechQueue:
     """Manages sequential speech synthesis and playback."""
@@ -18,8 +122,23 @@ class SpeechQueue:
         self._engine = engine
         self._player = player
         self._duck_media = duck_media
-        self._queue: asyncio.Queue = asyncio.Queue()
-        self._speaking = False
+        # Utterances in submission order, drained one at a time by the consumer task
+        self._queue: asyncio.Queue[tuple[str, str, float, asyncio.Future]] = asyncio.Queue()
+        self._consumer: asyncio.Task | None = None
+        # One worker: Kokoro runs a single ONNX session, so parallel syntheses
+        # would only contend. It synthesizes the next chunk during playback.
+        self._synth_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-synth")
+        # Playback gets its own lane so blocking player calls never wait behind
+        # unrelated work on the loop's default executor
+        self._play_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="tts-play")
+        # Double buffer for chunk samples: chunk i plays from one while chunk
+        # i+1 is synthesized into the other. Only the consumer task uses them.
+        self._scratch = (
+            np.empty(_SCRATCH_SECONDS * SAMPLE_RATE, dtype=np.float32),
+            np.empty(_SCRATCH_SECONDS * SAMPLE_RATE, dtype=np.float32),
+        )
+        # Build the sentence splitter now, so a Numba compile isn't paid on the first speak()
+        _sentence_ends("Warm up.")
 
     async def speak(
         self,
@@ -39,16 +158,42 @@ class SpeechQueue:
         Returns:
             SpeakResult with timing and status info.
         """
+        if self._consumer is None or self._consumer.done():
+            # Started on first use: the queue may be built before the event loop runs
+            self._consumer = asyncio.create_task(self._run())
+
+        fut = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((text, voice_id, speed, fut))
+
         if not block:
-            # Fire-and-forget: schedule as a background task
-            asyncio.create_task(self._speak_blocking(text, voice_id, speed))
             return SpeakResult(
                 success=True,
                 voice=voice_id,
                 queued=True,
             )
 
-        return await self._speak_blocking(text, voice_id, speed)
+        return await fut
+
+    async def _run(self) -> None:
+        """Consumer task: speak queued utterances one after another."""
+        while True:
+            text, voice_id, speed, fut = await self._queue.get()
+            try:
+                if fut.cancelled():
+                    continue  # the blocking caller gave up before its turn
+                result = await self._speak_blocking(text, voice_id, speed)
+                if not fut.done():
+                    fut.set_result(result)
+            except asyncio.CancelledError:
+                fut.cancel()
+                raise
+            except Exception as e:
+                # Keep consuming: one failed utterance must not strand later callers
+                logger.error(f"Speech failed: {e}")
+                if not fut.done():
+                    fut.set_exception(e)
+            finally:
+                self._queue.task_done()
 
     async def _speak_blocking(
         self,
@@ -58,26 +203,48 @@ class SpeechQueue:
     ) -> SpeakResult:
         """Internal: synthesize and play text, blocking until done."""
         loop = asyncio.get_running_loop()
-        self._speaking = True
         total_duration_ms = 0.0
         total_synthesis_ms = 0.0
 
         # Duck media for the entire utterance, not per-chunk
         paused_apps = duck() if self._duck_media else []
 
+        def synthesize(i: int) -> asyncio.Future:
+            # Run sync synthesis in the pool to avoid blocking the event loop
+            return loop.run_in_executor(
+                self._synth_pool, self._engine.synthesize_into,
+                chunks[i], voice_id, speed, self._scratch[i % 2],
+            )
+
+        ahead = None
+        streaming = None  # decided at the first chunk, once its sample rate is known
         try:
             chunks = self.chunk_text(text)
+            if chunks:
+                ahead = synthesize(0)
 
-            for chunk in chunks:
-                # Run sync synthesis in executor to avoid blocking the event loop
-                synthesis_result = await loop.run_in_executor(
-                    None, self._engine.synthesize, chunk, voice_id, speed
-                )
+            for i in range(len(chunks)):
+                synthesis_result = await ahead
                 total_synthesis_ms += synthesis_result.synthesis_ms
+                # Start the next chunk now so its synthesis overlaps this playback
+                ahead = synthesize(i + 1) if i + 1 < len(chunks) else None
+
+                if streaming is None:
+                    # One player process for the whole utterance where the player allows
+                    streaming = await loop.run_in_executor(
+                        self._play_pool, self._player.open_stream, synthesis_result.sample_rate
+                    )
+                if streaming:
+                    # Returns once the pipe has taken the samples, freeing their buffer
+                    if await loop.run_in_executor(
+                        self._play_pool, self._player.write, synthesis_result.samples
+                    ):
+                        continue
+                    break  # player exited or was stopped; close_stream reports it
 
                 # Run sync playback in executor
                 playback_result = await loop.run_in_executor(
-                    None,
+                    self._play_pool,
                     self._player.play,
                     synthesis_result.samples,
                     synthesis_result.sample_rate,
@@ -93,6 +260,19 @@ class SpeechQueue:
                         error=playback_result.error,
                     )
 
+            if streaming:
+                streaming = False
+                playback_result = await loop.run_in_executor(self._play_pool, self._player.close_stream)
+                total_duration_ms += playback_result.duration_ms
+                if not playback_result.success:
+                    return SpeakResult(
+                        success=False,
+                        voice=voice_id,
+                        duration_ms=total_duration_ms,
+                        synthesis_ms=total_synthesis_ms,
+                        error=playback_result.error,
+                    )
+
             return SpeakResult(
                 success=True,
                 voice=voice_id,
@@ -102,6 +282,11 @@ class SpeechQueue:
 
         except Exception as e:
             logger.error(f"Speech failed: {e}")
+            if streaming:
+                # Let chunks already written finish playing, as they would have unstreamed
+                streaming = False
+                playback_result = await loop.run_in_executor(self._play_pool, self._player.close_stream)
+                total_duration_ms += playback_result.duration_ms
             return SpeakResult(
                 success=False,
                 voice=voice_id,
@@ -110,16 +295,36 @@ class SpeechQueue:
                 error=str(e),
             )
         finally:
+            if streaming:
+                # Cancelled mid-stream: cut playback short rather than block the loop
+                self._player.stop()
+                self._player.close_stream()
+            if ahead is not None:
+                # Stopped early: drop the look-ahead result (the pool still finishes it
+                # before any later synthesis, so it can't overwrite a newer chunk)
+                ahead.cancel()
             unduck(paused_apps)
-            self._speaking = False
 
     def stop(self) -> bool:
-        """Stop current playback.
+        """Stop current playback and drop utterances still waiting in the queue.
 
         Returns:
             True if something was stopped.
         """
-        return self._player.stop()
+        dropped = False
+        while not self._queue.empty():
+            _, voice_id, _, fut = self._queue.get_nowait()
+            if not fut.done():
+                fut.set_result(SpeakResult(success=False, voice=voice_id, error="Playback stopped"))
+            self._queue.task_done()
+            dropped = True
+        return self._player.stop() or dropped
+
+    def close(self) -> None:
+        """Stop playback and shut down the synthesis and playback threads."""
+        self.stop()
+        self._synth_pool.shutdown(wait=False, cancel_futures=True)
+        self._play_pool.shutdown(wait=False, cancel_futures=True)
 
     @property
     def depth(self) -> int:
@@ -147,39 +352,4 @@ class SpeechQueue:
         if len(text) <= max_length:
             return [text]
 
-        # Split into sentences
-        sentences: list[str] = []
-        current = ""
-        i = 0
-        while i < len(text):
-            current += text[i]
-            # Check for sentence-ending punctuation followed by space or end of string
-            if text[i] in ".!?" and (i + 1 >= len(text) or text[i + 1] == " "):
-                sentences.append(current.strip())
-                current = ""
-                # Skip the space after punctuation
-                if i + 1 < len(text) and text[i + 1] == " ":
-                    i += 1
-            i += 1
-
-        # Add any remaining text
-        if current.strip():
-            sentences.append(current.strip())
-
-        # Group sentences into chunks under max_length
-        chunks: list[str] = []
-        current_chunk = ""
-
-        for sentence in sentences:
-            if not current_chunk:
-                current_chunk = sentence
-            elif len(current_chunk) + 1 + len(sentence) <= max_length:
-                current_chunk += " " + sentence
-            else:
-                chunks.append(current_chunk)
-                current_chunk = sentence
-
-        if current_chunk:
-            chunks.append(current_chunk)
-
-        return chunks
+        return list(_split_sentences(text, max_length))
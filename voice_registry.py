@@ -7,14 +7,26 @@ Maps agent names to Kokoro voice IDs with auto-discovery:
 3. Pool exhaustion fallback (reuses voices)
 """
 
+import asyncio
+import bisect
+import hashlib
 import json
+from collections import Counter
 from pathlib import Path
 from typing import Optional
 
-from shared import ALL_VOICE_IDS, VOICE_NAME_MAP, get_logger
+from shared import ALL_VOICE_IDS, VOICE_NAME_MAP, REGISTRY_SAVE_DEBOUNCE, get_logger
 
 logger = get_logger("voice-registry")
 
+# Frozen once at import: the pool-exhausted fallback indexes this by name hash
+_ALL_VOICES_SORTED = tuple(sorted(ALL_VOICE_IDS))
+
+
+def _stable_hash(name: str) -> int:
+    """Hash a name identically across runs (built-in hash() is salted per process)."""
+    return int.from_bytes(hashlib.blake2b(name.encode("utf-8"), digest_size=8).digest(), "little")
+
 
 class VoiceRegistry:
     """Manages agent name -> voice ID mappings with auto-discovery."""
@@ -28,11 +40,17 @@ class VoiceRegistry:
         self._registry: dict[str, str] = {}
         self._config_path = config_path
         self._default_voice = default_voice
+        # Bumped on every mapping change. _clean is the (path, generation) last
+        # loaded or saved, so save() can skip a config that already matches.
+        self._generation = 0
+        self._clean: Optional[tuple[Path, int]] = None
+        self._save_handle: Optional[asyncio.TimerHandle] = None
 
         if config_path and config_path.exists():
             self.load(config_path)
         elif preloaded_registry is not None:
             self._registry = dict(preloaded_registry)
+        self._rebuild_pool()
 
     def get_voice(self, name: str) -> tuple[str, bool]:
         """Return (voice_id, auto_assigned) for the given agent name.
@@ -51,27 +69,24 @@ class VoiceRegistry:
         lower_name = name.lower()
         if lower_name in VOICE_NAME_MAP:
             candidate = VOICE_NAME_MAP[lower_name]
-            assigned_voices = set(self._registry.values())
-            if candidate not in assigned_voices:
-                self._registry[name] = candidate
+            if candidate not in self._voice_counts:
+                self._assign(name, candidate)
                 logger.info(f"Auto-assigned voice '{candidate}' to '{name}' (name match)")
                 return (candidate, True)
 
         # 3. Hash-based assignment from unassigned pool
-        pool = self.get_available_pool()
+        pool = self._available
         if pool:
-            index = hash(name) % len(pool)
+            index = _stable_hash(name) % len(pool)
             voice_id = pool[index]
-            self._registry[name] = voice_id
+            self._assign(name, voice_id)
             logger.info(f"Auto-assigned voice '{voice_id}' to '{name}' (hash from pool)")
             return (voice_id, True)
 
         # 4. Pool exhausted — pick from full set
         logger.warning("All voices assigned, reusing voices.")
-        all_sorted = sorted(ALL_VOICE_IDS)
-        index = hash(name) % len(all_sorted)
-        voice_id = all_sorted[index]
-        self._registry[name] = voice_id
+        voice_id = _ALL_VOICES_SORTED[_stable_hash(name) % len(_ALL_VOICES_SORTED)]
+        self._assign(name, voice_id)
         logger.info(f"Auto-assigned voice '{voice_id}' to '{name}' (hash from full pool, reuse)")
         return (voice_id, True)
 
@@ -83,7 +98,7 @@ class VoiceRegistry:
         if voice_id not in ALL_VOICE_IDS:
             logger.warning(f"Invalid voice ID '{voice_id}' for '{name}'")
             return False
-        self._registry[name] = voice_id
+        self._assign(name, voice_id)
         logger.info(f"Set voice '{voice_id}' for '{name}'")
         return True
 
@@ -98,8 +113,8 @@ class VoiceRegistry:
             logger.warning(f"Invalid voice ID '{voice_id}' for rename '{old_name}' -> '{new_name}'")
             return False
         if old_name != new_name and old_name in self._registry:
-            del self._registry[old_name]
-        self._registry[new_name] = voice_id
+            self._release(self._registry.pop(old_name))
+        self._assign(new_name, voice_id)
         logger.info(f"Renamed '{old_name}' -> '{new_name}' with voice '{voice_id}'")
         return True
 
@@ -109,19 +124,84 @@ class VoiceRegistry:
 
     def get_available_pool(self) -> list[str]:
         """Return sorted list of voice IDs not currently assigned."""
-        assigned = set(self._registry.values())
-        return sorted(ALL_VOICE_IDS - assigned)
+        return list(self._available)
+
+    def _rebuild_pool(self) -> None:
+        """Recompute voice usage counts and the unassigned pool from the registry."""
+        self._voice_counts: Counter[str] = Counter(self._registry.values())
+        self._available: list[str] = sorted(ALL_VOICE_IDS - self._voice_counts.keys())
+
+    def _assign(self, name: str, voice_id: str) -> None:
+        """Map name to voice_id, keeping the usage counts and pool in step."""
+        old_voice = self._registry.get(name)
+        if old_voice == voice_id:
+            return
+        if old_voice is not None:
+            self._release(old_voice)
+        self._registry[name] = voice_id
+        self._mark_changed()
+        self._voice_counts[voice_id] += 1
+        if self._voice_counts[voice_id] == 1:
+            i = bisect.bisect_left(self._available, voice_id)
+            if i < len(self._available) and self._available[i] == voice_id:
+                del self._available[i]
+
+    def _release(self, voice_id: str) -> None:
+        """Drop one use of voice_id, returning it to the pool when unused."""
+        self._mark_changed()
+        self._voice_counts[voice_id] -= 1
+        if self._voice_counts[voice_id] <= 0:
+            del self._voice_counts[voice_id]
+            if voice_id in ALL_VOICE_IDS:
+                bisect.insort(self._available, voice_id)
+
+    def _mark_changed(self) -> None:
+        """Record a mapping change and schedule a debounced save."""
+        self._generation += 1
+        self.schedule_save()
+
+    def schedule_save(self, delay: Optional[float] = None) -> None:
+        """Save once changes settle, coalescing bursts of assignments.
+
+        Each call pushes the save back by delay seconds (default
+        REGISTRY_SAVE_DEBOUNCE); the save itself runs in a worker thread.
+        Without a running event loop or a config path this does nothing,
+        and the server's periodic save covers it.
+        """
+        if self._config_path is None:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        if self._save_handle is not None:
+            self._save_handle.cancel()
+        if delay is None:
+            delay = REGISTRY_SAVE_DEBOUNCE
+        self._save_handle = loop.call_later(delay, self._flush_scheduled_save, loop)
+
+    def _flush_scheduled_save(self, loop: asyncio.AbstractEventLoop) -> None:
+        self._save_handle = None
+        loop.run_in_executor(None, self.save)
 
     def save(self, config_path: Optional[Path] = None) -> None:
         """Save registry to config JSON file.
 
         Reads existing config, updates the voice_registry key, writes back.
+        The config is re-read every time because other tools (the menu bar)
+        edit it too. Skipped when the registry is unchanged since it was
+        last loaded from or saved to this path.
         """
         path = config_path or self._config_path
         if path is None:
             logger.warning("No config path specified, cannot save registry")
             return
 
+        generation = self._generation
+        if self._clean == (path, generation):
+            logger.debug(f"Registry unchanged, not rewriting {path}")
+            return
+
         if not path.exists():
             logger.warning("Config file does not exist, cannot save registry")
             return
@@ -134,6 +214,8 @@ class VoiceRegistry:
             return
 
         data["voice_registry"] = dict(self._registry)
+        if self._generation != generation:
+            generation = -1  # changed mid-save; leave this write marked stale
 
         # Atomic write: temp file + rename (prevents partial writes)
         import tempfile, os
@@ -142,6 +224,7 @@ class VoiceRegistry:
             with os.fdopen(fd, "w") as f:
                 json.dump(data, f, indent=2)
             os.replace(tmp_path, path)
+            self._clean = (path, generation)
         except Exception as e:
             logger.warning(f"Failed to save registry: {e}")
             try:
@@ -167,6 +250,8 @@ class VoiceRegistry:
                 data = json.load(f)
             if "voice_registry" in data:
                 self._registry = dict(data["voice_registry"])
+                self._rebuild_pool()
+                self._clean = (path, self._generation)
                 logger.debug(f"Loaded registry ({self.size} entries) from {path}")
         except (json.JSONDecodeError, OSError) as e:
             logger.warning(f"Error loading registry from {path}: {e}")
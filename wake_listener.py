@@ -10,7 +10,6 @@ via tmux send-keys.
 import fcntl
 import os
 import platform
-import queue
 import subprocess
 import threading
 import time
@@ -20,6 +19,7 @@ from typing import Optional
 
 import numpy as np
 
+import session_registry
 from shared import (
     STT_SAMPLE_RATE,
     WAKE_WORD_FRAME_SIZE,
@@ -34,6 +34,42 @@ from shared import (
 
 logger = get_logger("wake-listener")
 
+# Directories searched for wake word models, in order. A "<name>_int8.onnx"
+# (dynamically quantized, QInt8) file is preferred over "<name>.onnx": it is
+# ~4x smaller and uses int8 dot-product kernels on modern CPUs.
+_MODEL_DIRS = [
+    os.path.join(os.path.dirname(__file__), "models"),
+    os.path.expanduser("~/.local/share/voicesmith-mcp/models"),
+]
+
+# Nice value for the always-on listener thread (including its post-wake
+# recording and transcription), so it yields the CPU to the MCP request
+# handlers under contention (Linux only: nice there is per thread;
+# elsewhere it would apply to the whole server process)
+_LISTENER_NICE = 10
+
+# Mean absolute int16 level below which a wake frame counts as silence
+# (about -58 dBFS: under speech, including a quiet wake phrase, but above
+# a typical laptop mic's noise floor)
+_SILENCE_LEVEL = 40
+
+# Consecutive silent frames after which openwakeword's whole context (16
+# embeddings over ~0.8 s of mel frames, ~2 s in all) holds only silence
+_SILENT_CONTEXT_FRAMES = 32
+
+# Silero VAD scores audio in chunks of exactly this many samples at 16 kHz
+_VAD_CHUNK_SAMPLES = 512
+
+# Scale from int16 mic samples to float32 audio in [-1, 1)
+_INT16_TO_FLOAT = np.float32(1 / 32768)
+
+# openWakeWord's shared feature models, run on every frame ahead of the
+# wake word classifier, keyed by the Model() argument that overrides each
+_FEATURE_MODELS = {
+    "melspec_model_path": "melspectrogram",
+    "embedding_model_path": "embedding_model",
+}
+
 
 class WakeState(Enum):
     DISABLED = "disabled"
@@ -61,6 +97,7 @@ class WakeWordListener:
         self._threshold = threshold
         self._tmux_session = tmux_session
         self._ready_sound = self._resolve_sound(ready_sound)
+        self._ready_audio = self._load_sound(self._ready_sound)
         self._recording_timeout = recording_timeout
         self._no_speech_timeout = no_speech_timeout
 
@@ -70,9 +107,16 @@ class WakeWordListener:
         self._stop_event = threading.Event()
         self._yield_event = threading.Event()
         self._yield_done = threading.Event()
+        self._resume_event = threading.Event()  # set by reclaim_mic() and stop()
         self._thread: Optional[threading.Thread] = None
+        # Mic frames from the wake stream, shared with post-wake recording
+        self._ring = _FrameRing(WAKE_WORD_FRAME_SIZE)
         self._mic_lock_file = None
 
+        # Persistent tmux control-mode client for text injection (created on first use)
+        self._tmux_control: Optional[_TmuxControl] = None
+        self._tmux_control_disabled = False
+
         # Load openWakeWord model
         self._wake_model = None
         try:
@@ -80,16 +124,20 @@ class WakeWordListener:
 
             # Check for custom model in our models directory
             model_path = self._find_wake_model(wake_model_name)
+            # Quantized feature models, if installed, replace openwakeword's bundled ones
+            feature_paths = self._find_int8_feature_models()
             if model_path:
                 self._wake_model = Model(
                     wakeword_models=[model_path],
                     inference_framework="onnx",
+                    **feature_paths,
                 )
             else:
                 # Fall back to openwakeword's built-in models
                 self._wake_model = Model(
                     wakeword_models=[wake_model_name],
                     inference_framework="onnx",
+                    **feature_paths,
                 )
             logger.info(f"Wake word model loaded: {wake_model_name}")
         except Exception as e:
@@ -97,16 +145,26 @@ class WakeWordListener:
 
     @staticmethod
     def _find_wake_model(name: str) -> Optional[str]:
-        """Find a wake word model ONNX file by name."""
-        search_paths = [
-            os.path.join(os.path.dirname(__file__), "models", f"{name}.onnx"),
-            os.path.expanduser(f"~/.local/share/voicesmith-mcp/models/{name}.onnx"),
-        ]
-        for p in search_paths:
-            if os.path.exists(p):
-                return p
+        """Find a wake word model ONNX file by name, preferring an int8-quantized variant."""
+        for filename in (f"{name}_int8.onnx", f"{name}.onnx"):
+            for directory in _MODEL_DIRS:
+                p = os.path.join(directory, filename)
+                if os.path.exists(p):
+                    return p
         return None
 
+    @staticmethod
+    def _find_int8_feature_models() -> dict[str, str]:
+        """Return Model() keyword arguments for any installed int8 feature models."""
+        paths = {}
+        for kwarg, stem in _FEATURE_MODELS.items():
+            for directory in _MODEL_DIRS:
+                p = os.path.join(directory, f"{stem}_int8.onnx")
+                if os.path.exists(p):
+                    paths[kwarg] = p
+                    break
+        return paths
+
     @staticmethod
     def _resolve_sound(sound: str) -> Optional[str]:
         """Resolve a sound name to a file path."""
@@ -120,6 +178,48 @@ class WakeWordListener:
             return sound
         return None
 
+    @staticmethod
+    def _load_sound(path: Optional[str]) -> Optional[tuple[np.ndarray, int]]:
+        """Decode a sound file once, so each wake plays it without spawning a player."""
+        if path is None:
+            return None
+        try:
+            import soundfile as sf
+
+            data, sample_rate = sf.read(path, dtype="float32")
+            return data, sample_rate
+        except Exception as e:
+            logger.debug(f"Could not preload ready sound {path}: {e}")
+            return None
+
+    def _play_ready_sound(self):
+        """Play the ready sound to completion, from memory when it was preloaded."""
+        if self._ready_audio is not None:
+            try:
+                import sounddevice as sd
+
+                data, sample_rate = self._ready_audio
+                sd.play(data, sample_rate, blocking=True)
+                return
+            except Exception as e:
+                logger.debug(f"In-process ready sound failed, using a player: {e}")
+
+        try:
+            if platform.system() == "Darwin":
+                subprocess.run(
+                    ["afplay", self._ready_sound],
+                    capture_output=True,
+                    timeout=2,
+                )
+            else:
+                subprocess.run(
+                    ["aplay", self._ready_sound],
+                    capture_output=True,
+                    timeout=2,
+                )
+        except Exception:
+            pass
+
     def start(self):
         """Start the wake word listener thread."""
         if self._wake_model is None:
@@ -129,7 +229,12 @@ class WakeWordListener:
             logger.warning("Wake listener already running")
             return
 
+        # Drop yield/resume state left by a stop() while yielded, or the new
+        # loop would start yielded with a stale resume and spin between states
         self._stop_event.clear()
+        self._yield_event.clear()
+        self._yield_done.clear()
+        self._resume_event.clear()
         self._thread = threading.Thread(target=self._listen_loop, daemon=True)
         self._thread.start()
         logger.info("Wake word listener started")
@@ -137,6 +242,8 @@ class WakeWordListener:
     def stop(self):
         """Stop the wake word listener."""
         self._stop_event.set()
+        self._resume_event.set()  # wake a yielded loop so it can exit
+        self._ring.wake()  # and one waiting on the mic
         with self._state_lock:
             self._state = WakeState.DISABLED
         if self._thread is not None:
@@ -150,6 +257,9 @@ class WakeWordListener:
             except Exception:
                 pass
             self._mic_lock_file = None
+        if self._tmux_control is not None:
+            self._tmux_control.close()
+            self._tmux_control = None
         logger.info("Wake word listener stopped")
 
     def yield_mic(self):
@@ -157,7 +267,10 @@ class WakeWordListener:
         with self._state_lock:
             if self._state != WakeState.LISTENING:
                 return
+        # Drop any reclaim from before this yield, or the loop would resume at once
+        self._resume_event.clear()
         self._yield_event.set()
+        self._ring.wake()
         # Wait for the listener to actually pause
         self._yield_done.wait(timeout=3)
         logger.debug("Wake listener yielded mic")
@@ -166,6 +279,7 @@ class WakeWordListener:
         """Resume listening after the AI listen tool is done."""
         self._yield_event.clear()
         self._yield_done.clear()
+        self._resume_event.set()
         logger.debug("Wake listener reclaiming mic")
 
     @property
@@ -197,29 +311,36 @@ class WakeWordListener:
         with self._state_lock:
             self._state = WakeState.LISTENING
 
+        _lower_thread_priority()
+
         while not self._stop_event.is_set():
             # Check for yield request
             if self._yield_event.is_set():
                 with self._state_lock:
                     self._state = WakeState.YIELDED
                 self._yield_done.set()
-                # Wait until reclaim
+                # Sleep until reclaim_mic() or stop(); no polling while yielded
                 while self._yield_event.is_set() and not self._stop_event.is_set():
-                    time.sleep(0.1)
+                    self._resume_event.wait()
+                    self._resume_event.clear()
                 if self._stop_event.is_set():
                     break
                 with self._state_lock:
                     self._state = WakeState.LISTENING
                 continue
 
-            # Open mic for wake word detection
-            audio_queue = queue.Queue()
+            # Open mic for wake word detection; it stays open across detections,
+            # since recording after the wake word reads from the same ring
+            ring = self._ring
+            ring.clear()
+            gate = _SilenceGate()
 
             def callback(indata, frames, time_info, status):
-                audio_queue.put(indata[:, 0].copy())
+                # Raw stream: wrap the driver's buffer in place; push() copies it out
+                ring.push(np.frombuffer(indata, dtype=np.int16))
 
             try:
-                stream = sd.InputStream(
+                stream = sd.RawInputStream(
                     samplerate=STT_SAMPLE_RATE,
                     channels=1,
                     dtype="int16",
@@ -229,31 +350,30 @@ class WakeWordListener:
                 stream.start()
             except Exception as e:
                 logger.error(f"Failed to open mic for wake word: {e}")
-                time.sleep(1)
+                self._stop_event.wait(1)  # back off, but let stop() cut it short
                 continue
 
             try:
                 while not self._stop_event.is_set() and not self._yield_event.is_set():
-                    try:
-                        chunk = audio_queue.get(timeout=0.2)
-                    except queue.Empty:
+                    chunk = ring.pop(timeout=0.2)
+                    if chunk is None or gate.skip(chunk):
                         continue
 
                     prediction = self._wake_model.predict(chunk)
                     for name, score in prediction.items():
                         if score > self._threshold:
                             logger.info(f"Wake word detected: {name} ({score:.3f})")
-                            stream.stop()
-                            stream.close()
                             self._handle_wake_detected()
-                            # Break out to reopen stream for next detection
-                            raise _WakeDetected()
+                            # Detect afresh: drop openwakeword's buffered features of the
+                            # wake phrase, and audio queued while transcribing
+                            self._wake_model.reset()
+                            ring.clear()
+                            gate.reset()
+                            break
 
-            except _WakeDetected:
-                continue  # Restart the outer loop to reopen the stream
             except Exception as e:
                 logger.error(f"Wake listener error: {e}")
-                time.sleep(1)
+                self._stop_event.wait(1)
             finally:
                 try:
                     stream.stop()
@@ -275,122 +395,90 @@ class WakeWordListener:
             self._state = WakeState.DISABLED
 
     def _handle_wake_detected(self):
-        """Record speech after wake word, transcribe, and inject."""
-        import sounddevice as sd
+        """Record speech after wake word, transcribe, and inject.
 
+        Reads from the wake word stream's ring, so the mic isn't reopened.
+        """
+        ring = self._ring
         with self._state_lock:
             self._state = WakeState.RECORDING
 
-        # Flush and wait for audio system to settle
-        # Needs enough time for the wake phrase audio to clear from the mic buffer
+        # Wait for the audio system to settle; the tail of the wake phrase
+        # (and the ready sound) is discarded from the ring before recording
         time.sleep(0.5)
 
         # Play ready sound
         if self._ready_sound:
-            try:
-                if platform.system() == "Darwin":
-                    subprocess.run(
-                        ["afplay", self._ready_sound],
-                        capture_output=True,
-                        timeout=2,
-                    )
-                else:
-                    subprocess.run(
-                        ["aplay", self._ready_sound],
-                        capture_output=True,
-                        timeout=2,
-                    )
-            except Exception:
-                pass
+            self._play_ready_sound()
 
         # Record speech with VAD
-        audio_queue = queue.Queue()
-
-        def callback(indata, frames, time_info, status):
-            audio_queue.put(indata.copy())
-
-        # Retry stream open up to 3 times
-        stream = None
-        for attempt in range(3):
-            try:
-                stream = sd.InputStream(
-                    samplerate=STT_SAMPLE_RATE,
-                    channels=1,
-                    dtype="float32",
-                    blocksize=512,
-                    callback=callback,
-                )
-                stream.start()
-                break
-            except Exception as e:
-                logger.warning(f"Mic open attempt {attempt + 1} failed: {e}")
-                time.sleep(0.2)
-
-        if stream is None:
-            logger.error("Failed to open mic for recording after 3 attempts")
-            with self._state_lock:
-                self._state = WakeState.LISTENING
-            return
-
-        # Reset VAD state
+        ring.clear()
         self._vad.reset()
 
-        chunks = []
+        # Sized for the longest allowed recording, plus a second for frames still
+        # queued at the timeout, so each frame is written once and never moved
+        recorded = np.empty(int((self._recording_timeout + 1) * STT_SAMPLE_RATE), dtype=np.float32)
+        n_recorded = 0
+        n_scored = 0  # samples already passed to the VAD
         speech_detected = False
         silence_duration = 0.0
         start_time = time.time()
 
-        try:
-            while True:
-                elapsed = time.time() - start_time
+        while True:
+            if self._stop_event.is_set():
+                return
 
-                # Max recording timeout
-                if elapsed >= self._recording_timeout:
-                    logger.info("Recording timeout reached")
-                    break
+            elapsed = time.time() - start_time
 
-                # No speech timeout
-                if not speech_detected and elapsed >= self._no_speech_timeout:
-                    logger.info("No speech after wake word — aborting")
-                    stream.stop()
-                    stream.close()
-                    with self._state_lock:
-                        self._state = WakeState.LISTENING
-                    return
+            # Max recording timeout
+            if elapsed >= self._recording_timeout:
+                logger.info("Recording timeout reached")
+                break
 
-                try:
-                    chunk = audio_queue.get(timeout=0.1)
-                except queue.Empty:
-                    continue
+            # No speech timeout
+            if not speech_detected and elapsed >= self._no_speech_timeout:
+                logger.info("No speech after wake word — aborting")
+                with self._state_lock:
+                    self._state = WakeState.LISTENING
+                return
 
-                chunks.append(chunk)
-                flat = chunk.flatten()
-                is_speech = self._vad.is_speech(flat)
+            frame = ring.pop(timeout=0.1)
+            if frame is None:
+                continue
 
-                if is_speech:
+            end = n_recorded + len(frame)
+            if end > len(recorded):
+                logger.info("Recording buffer full")
+                break
+            # int16 mic samples to float32 in [-1, 1), written straight into the recording
+            np.multiply(frame, _INT16_TO_FLOAT, out=recorded[n_recorded:end], casting="unsafe")
+            n_recorded = end
+
+            # Silero VAD scores fixed 512-sample chunks; each frame completes two or three
+            silence_reached = False
+            while n_scored + _VAD_CHUNK_SAMPLES <= n_recorded:
+                chunk = recorded[n_scored:n_scored + _VAD_CHUNK_SAMPLES]
+                n_scored += _VAD_CHUNK_SAMPLES
+                if self._vad.is_speech(chunk):
                     speech_detected = True
                     silence_duration = 0.0
                 elif speech_detected:
-                    chunk_duration = len(flat) / STT_SAMPLE_RATE
-                    silence_duration += chunk_duration
+                    silence_duration += _VAD_CHUNK_SAMPLES / STT_SAMPLE_RATE
                     if silence_duration >= 1.5:
-                        logger.info("Silence detected — stopping recording")
+                        silence_reached = True
                         break
-        finally:
-            try:
-                stream.stop()
-                stream.close()
-            except Exception:
-                pass
+            if silence_reached:
+                logger.info("Silence detected — stopping recording")
+                break
 
-        if not speech_detected or not chunks:
+        if not speech_detected or not n_recorded:
             logger.info("No speech captured")
             with self._state_lock:
                 self._state = WakeState.LISTENING
             return
 
         # Transcribe
-        audio = np.concatenate(chunks).flatten()
+        audio = recorded[:n_recorded]
         logger.info(f"Transcribing {len(audio) / STT_SAMPLE_RATE:.1f}s of audio...")
 
         try:
@@ -417,9 +505,7 @@ class WakeWordListener:
 
     def _inject_text(self, text: str):
         """Route transcribed text to the correct tmux session."""
-        from session_registry import get_active_sessions
-
-        sessions = get_active_sessions()
+        sessions = session_registry.get_active_sessions()
         # Filter to sessions with tmux
         tmux_sessions = [s for s in sessions if s.get("tmux_session")]
 
@@ -437,9 +523,9 @@ class WakeWordListener:
             # Multiple sessions — parse first word as session name
             words = text.split(None, 1)
             if len(words) >= 1:
-                first_word = words[0].strip(".,!?:")
+                first_word = words[0].strip(".,!?:").lower()
                 for s in tmux_sessions:
-                    if first_word.lower() == s["name"].lower():
+                    if first_word == s["name"].lower():
                         target_tmux = s["tmux_session"]
                         message = words[1] if len(words) > 1 else ""
                         break
@@ -452,16 +538,27 @@ class WakeWordListener:
             logger.info("Empty message after name parsing — skipping injection")
             return
 
-        # Send via tmux (literal mode to prevent shell injection)
+        # Fast path: write to the persistent control-mode client (no process spawn)
+        target_q = _tmux_quote(target_tmux)
+        command = f"send-keys -t {target_q} -l {_tmux_quote(message)} ; send-keys -t {target_q} Enter"
+        if self._send_tmux_control(target_tmux, command):
+            logger.info(f"Injected text into tmux session '{target_tmux}'")
+            return
+
+        # tmux treats any argument ending in ';' as a command separator;
+        # '\;' keeps a trailing semicolon literal
+        if message.endswith(";"):
+            message = message[:-1] + "\\;"
+
+        # Send text and Enter in one tmux client (literal mode prevents shell injection)
         try:
             subprocess.run(
-                ["tmux", "send-keys", "-t", target_tmux, "-l", message],
-                capture_output=True,
-                timeout=5,
-            )
-            subprocess.run(
-                ["tmux", "send-keys", "-t", target_tmux, "Enter"],
-                capture_output=True,
+                [
+                    "tmux", "send-keys", "-t", target_tmux, "-l", message,
+                    ";", "send-keys", "-t", target_tmux, "Enter",
+                ],
+                stdout=subprocess.DEVNULL,  # output is never read: no pipes to set up and drain
+                stderr=subprocess.DEVNULL,
                 timeout=5,
             )
             logger.info(f"Injected text into tmux session '{target_tmux}'")
@@ -472,7 +569,196 @@ class WakeWordListener:
         except Exception as e:
             logger.error(f"tmux injection failed: {e}")
 
-
-class _WakeDetected(Exception):
-    """Internal signal for breaking out of nested loops on wake detection."""
-    pass
+    def _send_tmux_control(self, target_tmux: str, command: str) -> bool:
+        """Send a command line through the control-mode client, attaching if needed.
+
+        Returns False if the client is unavailable; the caller then falls
+        back to spawning tmux. A client that never attaches (tmux < 3.2,
+        missing tmux) disables the fast path for this listener.
+        """
+        if self._tmux_control_disabled:
+            return False
+        control = self._tmux_control
+        if control is None or not control.alive():
+            try:
+                control = self._tmux_control = _TmuxControl(target_tmux)
+            except Exception as e:
+                logger.debug(f"tmux control mode unavailable: {e}")
+                self._tmux_control_disabled = True
+                return False
+            if not control.wait_attached():
+                logger.debug("tmux control client failed to attach — using send-keys")
+                self._tmux_control_disabled = True
+                self._tmux_control = None
+                control.close()
+                return False
+        return control.send(command)
+
+
+def _lower_thread_priority():
+    """Renice the calling thread to _LISTENER_NICE where that affects only the thread.
+
+    This lasts for the thread's life, so it also covers the post-wake work the
+    listener thread runs itself: ready sound, VAD scoring and Whisper
+    transcription. That is not undone around a wake because an unprivileged
+    thread can't lower its nice value again (RLIMIT_NICE is usually 0). Only
+    contended CPU is affected; on an idle machine the work runs at full speed.
+    """
+    if platform.system() != "Linux":
+        return
+    try:
+        os.setpriority(os.PRIO_PROCESS, threading.get_native_id(), _LISTENER_NICE)
+    except OSError as e:
+        logger.debug(f"Could not lower wake listener priority: {e}")
+
+
+def _tmux_quote(arg: str) -> str:
+    """Quote a string as one literal argument in tmux command syntax.
+
+    Single quotes disable $VAR, ~ and ';' handling; an embedded quote is
+    closed, escaped and reopened as in sh. Newlines would end the command,
+    so they become spaces.
+    """
+    arg = arg.replace("\r", " ").replace("\n", " ")
+    return "'" + arg.replace("'", "'\\''") + "'"
+
+
+class _TmuxControl:
+    """A persistent `tmux -C` client that runs commands written to its stdin.
+
+    Attaches with ignore-size (never resizes the user's windows) and
+    no-output (no pane output streamed back). A daemon thread drains the
+    command replies so the pipe never fills.
+    """
+
+    def __init__(self, session: str):
+        self._attached = threading.Event()
+        self._done = threading.Event()
+        self._proc = subprocess.Popen(
+            ["tmux", "-C", "attach-session", "-t", session, "-f", "ignore-size,no-output"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.DEVNULL,
+        )
+        threading.Thread(target=self._drain, daemon=True).start()
+
+    def _drain(self):
+        for line in self._proc.stdout:
+            if line.startswith(b"%session-changed"):
+                self._attached.set()
+            elif line.startswith(b"%exit"):
+                break
+        self._done.set()
+
+    def wait_attached(self, timeout: float = 2.0) -> bool:
+        """Block until the client has attached; False if it exited or timed out."""
+        deadline = time.monotonic() + timeout
+        while not self._attached.is_set():
+            if self._done.is_set() or time.monotonic() >= deadline:
+                return False
+            self._attached.wait(0.05)
+        return True
+
+    def alive(self) -> bool:
+        return not self._done.is_set() and self._proc.poll() is None
+
+    def send(self, command: str) -> bool:
+        if not self.alive():
+            return False
+        try:
+            self._proc.stdin.write(command.encode() + b"\n")
+            self._proc.stdin.flush()
+            return True
+        except (OSError, ValueError):
+            return False
+
+    def close(self):
+        """Detach (EOF on stdin) and reap the client."""
+        try:
+            self._proc.stdin.close()
+            self._proc.wait(timeout=1)
+        except Exception:
+            self._proc.kill()
+
+
+class _SilenceGate:
+    """Decides when a wake frame can skip inference because the mic is silent.
+
+    Silent frames still go to the model until its whole context is silence;
+    after that more silence can't change its output, so frames are skipped
+    until one is loud enough to matter. Skipping from the first silent frame
+    would leave stale speech features in openwakeword's rolling buffers.
+    """
+
+    def __init__(self, level: int = _SILENCE_LEVEL, context_frames: int = _SILENT_CONTEXT_FRAMES):
+        self._level = level
+        self._context_frames = context_frames
+        self._silent = 0  # consecutive silent frames seen
+
+    def skip(self, frame: np.ndarray) -> bool:
+        """Return True if predict() can be skipped for this int16 frame."""
+        # int32 so abs(-32768) can't wrap
+        if np.abs(frame, dtype=np.int32).mean() >= self._level:
+            self._silent = 0
+            return False
+        self._silent += 1
+        return self._silent > self._context_frames
+
+    def reset(self) -> None:
+        self._silent = 0
+
+
+class _FrameRing:
+    """Single-producer, single-consumer ring of preallocated int16 audio frames.
+
+    The audio callback copies each block into a free slot instead of
+    allocating an array and taking a Queue mutex per frame. Each side only
+    advances its own counter, which the GIL makes safe without a lock. One
+    slot is kept back so the frame last returned by pop() is never
+    overwritten while the caller is still using it.
+    """
+
+    def __init__(self, frame_size: int, slots: int = 8):
+        self._frames = np.zeros((slots, frame_size), dtype=np.int16)
+        self._lengths = [0] * slots
+        self._slots = slots
+        self._head = 0  # frames written; advanced only by push()
+        self._tail = 0  # frames read; advanced only by pop() and clear()
+        self._ready = threading.Event()
+
+    def push(self, samples) -> None:
+        """Copy one block of samples into the ring (audio callback side)."""
+        head = self._head
+        if head - self._tail >= self._slots - 1:
+            return  # consumer fell behind: drop this frame, keep what is queued
+        slot = head % self._slots
+        n = min(len(samples), self._frames.shape[1])
+        np.copyto(self._frames[slot, :n], samples[:n], casting="unsafe")
+        self._lengths[slot] = n
+        self._head = head + 1
+        self._ready.set()
+
+    def pop(self, timeout: float) -> Optional[np.ndarray]:
+        """Return a view of the oldest frame, or None on timeout or wake().
+
+        The view stays valid until the next pop().
+        """
+        if self._head == self._tail:
+            self._ready.clear()
+            # Re-check after clearing so a push in between isn't missed
+            if self._head == self._tail:
+                self._ready.wait(timeout)
+                if self._head == self._tail:
+                    return None  # timed out, or woken by wake()
+        slot = self._tail % self._slots
+        self._tail += 1
+        return self._frames[slot, :self._lengths[slot]]
+
+    def wake(self) -> None:
+        """Make a waiting pop() return now, with None if no frame arrived."""
+        self._ready.set()
+
+    def clear(self) -> None:
+        """Discard queued frames (consumer side; safe while the stream runs)."""
+        self._tail = self._head
+        self._ready.clear()